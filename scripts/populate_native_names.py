@@ -26,6 +26,9 @@ HEADERS = {"User-Agent": "quran-ebook/1.0"}
 # Other languages return the same romanized name — skip them.
 NATIVE_SCRIPT_LANGS = {"ur", "fa", "ps", "ku", "ug", "sd"}
 
+# libyaml-backed loader when available (much faster than the pure-Python one).
+YAML_LOADER = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
 
 def fetch_translations(language: str) -> list[dict]:
     """Fetch translation metadata from Quran.com API for a given language."""
@@ -59,7 +62,7 @@ def process_configs(write: bool = False) -> None:
 
     for config_path in sorted(CONFIGS_DIR.rglob("*.yaml")):
         with config_path.open() as f:
-            raw = yaml.safe_load(f)
+            raw = yaml.load(f, Loader=YAML_LOADER)
         if not raw or "translation" not in raw:
             continue
 
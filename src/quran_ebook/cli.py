@@ -1,20 +1,21 @@
 """Command-line interface for quran-ebook."""
 
+import os
 import re
 import shutil
 import subprocess
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import click
 
-from .config.schema import load_config
-from .data.cache import cache_clear
-from .data.validate import AYAH_COUNTS_HAFS, AYAH_COUNTS_WARSH
-from .epub.builder import build_epub
+# Build/validation modules (pydantic, jinja2, fontTools, ...) are imported
+# inside the commands that need them so `--help` and `clear-cache` start fast.
 
 _AYAH_ID_RE = re.compile(r'id="ayah-(\d+)-(\d+)"')
 _MIN_COVER_BYTES = 1000  # Cover PNG should be at least 1KB
+_MAX_EPUBCHECK_WORKERS = 8  # Concurrent epubcheck JVMs in `validate`
 
 @click.group()
 @click.version_option()
@@ -31,14 +32,27 @@ def main():
     default=None,
     help="Build all .yaml configs in the given directory (recursive).",
 )
-def build(config_paths: tuple[str, ...], build_all: str | None):
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of configs to build in parallel (0 = one per CPU core).",
+)
+def build(config_paths: tuple[str, ...], build_all: str | None, jobs: int):
     """Build EPUBs from one or more YAML configuration files.
 
     Pass one or more config paths, or use --all DIR to build every .yaml in DIR.
+    With --jobs > 1, configs are built in separate processes and each result
+    is reported as it finishes.
     """
+    from .config.schema import load_config
+    from .epub.builder import build_epub
+
     if build_all is not None:
         search_dir = Path(build_all)
-        config_paths = tuple(str(p) for p in sorted(search_dir.rglob("*.yaml")))
+        config_paths = tuple(_find_configs(search_dir))
         if not config_paths:
             click.secho(f"No .yaml files found in {search_dir}/.", fg="red", err=True)
             raise SystemExit(1)
@@ -47,24 +61,73 @@ def build(config_paths: tuple[str, ...], build_all: str | None):
         click.secho("Provide one or more config paths, or use --all.", fg="red", err=True)
         raise SystemExit(1)
 
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(config_paths))
+
     failed = []
-    for config_path in config_paths:
-        click.echo(f"\nBuilding: {config_path}")
-        try:
-            config = load_config(config_path)
-            for warning in config.warnings:
-                click.secho(f"  Warning: {warning}", fg="yellow", err=True)
-            output_path = build_epub(config)
-            click.secho(f"  Done: {output_path}", fg="green")
-        except Exception as e:
-            click.secho(f"  Failed: {e}", fg="red", err=True)
-            failed.append(config_path)
+    if jobs == 1:
+        for config_path in config_paths:
+            click.echo(f"\nBuilding: {config_path}")
+            try:
+                config = load_config(config_path)
+                for warning in config.warnings:
+                    click.secho(f"  Warning: {warning}", fg="yellow", err=True)
+                output_path = build_epub(config)
+                click.secho(f"  Done: {output_path}", fg="green")
+            except Exception as e:
+                click.secho(f"  Failed: {e}", fg="red", err=True)
+                failed.append(config_path)
+    else:
+        click.echo(f"\nBuilding {len(config_paths)} configs with {jobs} parallel jobs")
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_build_one, p) for p in config_paths]
+            for future in as_completed(futures):
+                config_path, warnings, output_path, error = future.result()
+                click.echo(f"\nBuilt: {config_path}")
+                for warning in warnings:
+                    click.secho(f"  Warning: {warning}", fg="yellow", err=True)
+                if error is None:
+                    click.secho(f"  Done: {output_path}", fg="green")
+                else:
+                    click.secho(f"  Failed: {error}", fg="red", err=True)
+                    failed.append(config_path)
 
     if failed:
         click.secho(f"\n{len(failed)} build(s) failed: {', '.join(failed)}", fg="red", err=True)
         raise SystemExit(1)
 
 
+def _find_configs(directory: Path) -> list[str]:
+    """Recursively collect .yaml config paths under DIRECTORY, in tree order."""
+    found = []
+    for root, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        found.extend(
+            os.path.join(root, name) for name in sorted(filenames) if name.endswith(".yaml")
+        )
+    return found
+
+
+def _build_one(config_path: str) -> tuple[str, list[str], str | None, str | None]:
+    """Build a single config in a worker process.
+
+    Returns (config_path, warnings, output_path, error). Exceptions are
+    returned as messages so one failed build doesn't abort the pool.
+    """
+    from .config.schema import load_config
+    from .epub.builder import build_epub
+
+    warnings: list[str] = []
+    try:
+        config = load_config(config_path)
+        warnings = config.warnings
+        output_path = build_epub(config)
+    except Exception as e:
+        return config_path, warnings, None, str(e)
+    return config_path, warnings, str(output_path), None
+
+
 @main.command()
 @click.argument("directory", default="output", type=click.Path(exists=True, file_okay=False))
 @click.option("--no-epubcheck", is_flag=True, help="Skip epubcheck, only run content verification.")
@@ -77,7 +140,11 @@ def validate(directory: str, no_epubcheck: bool):
 
     Use --no-epubcheck to skip the second pass (faster, no Java dependency).
     """
-    epub_files = sorted(Path(directory).glob("*.epub"))
+    with os.scandir(directory) as entries:
+        epub_names = sorted(
+            e.name for e in entries if e.name.endswith(".epub") and e.is_file()
+        )
+    epub_files = [Path(directory, name) for name in epub_names]
     if not epub_files:
         click.secho(f"No .epub files found in {directory}/.", fg="red", err=True)
         raise SystemExit(1)
@@ -119,21 +186,27 @@ def validate(directory: str, no_epubcheck: bool):
             click.echo()
             click.secho("Running epubcheck...", bold=True)
             epubcheck_failed = []
-            for i, epub_path in enumerate(epub_files, 1):
-                result = subprocess.run(
-                    [epubcheck_bin, str(epub_path)],
-                    capture_output=True, text=True,
+            # Each epubcheck run is a separate JVM; run them concurrently and
+            # report in file order as results arrive (map preserves order).
+            workers = min(_MAX_EPUBCHECK_WORKERS, os.cpu_count() or 1, total)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    lambda p: subprocess.run(
+                        [epubcheck_bin, str(p)], capture_output=True, text=True,
+                    ),
+                    epub_files,
                 )
-                if result.returncode != 0:
-                    errs = [l for l in result.stderr.splitlines() if "ERROR" in l or "FATAL" in l]
-                    click.secho(f"[{i}/{total}] FAIL ({len(errs)}): {epub_path.name}", fg="red")
-                    for err in errs[:5]:
-                        click.echo(f"  {err}")
-                    if len(errs) > 5:
-                        click.echo(f"  ... and {len(errs) - 5} more errors")
-                    epubcheck_failed.append(epub_path.name)
-                else:
-                    click.secho(f"[{i}/{total}] OK: {epub_path.name}", fg="green")
+                for i, (epub_path, result) in enumerate(zip(epub_files, results), 1):
+                    if result.returncode != 0:
+                        errs = [l for l in result.stderr.splitlines() if "ERROR" in l or "FATAL" in l]
+                        click.secho(f"[{i}/{total}] FAIL ({len(errs)}): {epub_path.name}", fg="red")
+                        for err in errs[:5]:
+                            click.echo(f"  {err}")
+                        if len(errs) > 5:
+                            click.echo(f"  ... and {len(errs) - 5} more errors")
+                        epubcheck_failed.append(epub_path.name)
+                    else:
+                        click.secho(f"[{i}/{total}] OK: {epub_path.name}", fg="green")
 
             click.echo()
             if epubcheck_failed:
@@ -154,6 +227,8 @@ def validate(directory: str, no_epubcheck: bool):
 
 def _verify_epub_content(epub_path: Path) -> list[str]:
     """Verify EPUB content integrity: chapters, ayah counts, cover image."""
+    from .data.validate import AYAH_COUNTS_HAFS, AYAH_COUNTS_WARSH
+
     # Detect riwayah from filename (e.g. quran_warsh_... → warsh)
     is_warsh = "_warsh_" in epub_path.name
     ayah_counts = AYAH_COUNTS_WARSH if is_warsh else AYAH_COUNTS_HAFS
@@ -204,6 +279,8 @@ def _verify_epub_content(epub_path: Path) -> list[str]:
 @main.command()
 def clear_cache():
     """Clear all cached data and fonts."""
+    from .data.cache import cache_clear
+
     count = cache_clear()
     click.echo(f"Cleared {count} cached files.")
 
@@ -11,7 +11,7 @@ The fix (identified by bilalsaci) is to use matched script+font combinations.
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FontInfo:
     """Metadata for a downloadable font."""
 
@@ -402,6 +402,13 @@ NATIVE_LANGUAGE_NAMES: dict[str, str] = {
 }
 
 
+ABBREV_TABLES: dict[str, dict[str, str]] = {
+    "script": ABBREV_SCRIPTS,
+    "font": ABBREV_FONTS,
+    "layout": ABBREV_LAYOUTS,
+}
+
+
 def abbreviate(category: str, key: str) -> str:
     """Get the shorthand abbreviation for a key.
 
@@ -413,10 +420,7 @@ def abbreviate(category: str, key: str) -> str:
         The shorthand code, or the key itself if no abbreviation exists.
         For "script", returns empty string if the script needs no tag.
     """
-    tables = {
-        "script": ABBREV_SCRIPTS,
-        "font": ABBREV_FONTS,
-        "layout": ABBREV_LAYOUTS,
-    }
-    table = tables.get(category, {})
+    table = ABBREV_TABLES.get(category)
+    if table is None:
+        return key
     return table.get(key, key)
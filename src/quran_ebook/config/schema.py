@@ -1,28 +1,47 @@
 """Build configuration schema."""
 
+from functools import cached_property
 from pathlib import Path
 
 import yaml
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from .registry import FONTS, abbreviate, get_riwayah, validate_script_font_pair
+from .registry import (
+    ABBREV_FONTS,
+    ABBREV_LAYOUTS,
+    ABBREV_SCRIPTS,
+    FONTS,
+    get_riwayah,
+    validate_script_font_pair,
+)
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load.
+_YAML_LOADER = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
 
 
 class BookConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str = "القرآن الكريم"
     language: str = "ar"
 
 
 class QuranConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     script: str = "qpc_uthmani_hafs"
     source: str = "quran_api"
 
 
 class FontConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     arabic: str = "kfgqpc_uthmanic_hafs"
 
 
 class LayoutConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     structure: str = "inline"
     show_ayah_numbers: bool = True
     show_bismillah: bool = True
@@ -31,6 +50,8 @@ class LayoutConfig(BaseModel):
 
 
 class TranslationConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     resource_id: int | None = 20  # Sahih International (Quran.com API)
     language: str = "en"
     name: str = "Sahih International"
@@ -49,6 +70,8 @@ class TranslationConfig(BaseModel):
 class TafsirConfig(BaseModel):
     """Tafsir/commentary source for bilingual+interactive popup content."""
 
+    model_config = ConfigDict(frozen=True)
+
     resource_id: int
     source: str = "qul_tafsir"  # "qul_tafsir" or "qul"
     name: str
@@ -64,6 +87,8 @@ class TafsirConfig(BaseModel):
 
 
 class OutputConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     filename: str = ""  # Empty = auto-generate from config
     directory: str = "output"
 
@@ -71,21 +96,19 @@ class OutputConfig(BaseModel):
 class BuildConfig(BaseModel):
     """Top-level build configuration."""
 
-    book: BookConfig = BookConfig()
-    quran: QuranConfig = QuranConfig()
-    font: FontConfig = FontConfig()
+    book: BookConfig = Field(default_factory=BookConfig)
+    quran: QuranConfig = Field(default_factory=QuranConfig)
+    font: FontConfig = Field(default_factory=FontConfig)
     translation: TranslationConfig | None = None  # None = Arabic-only
     tafsir: TafsirConfig | None = None  # Optional tafsir for bilingual+interactive popup
-    layout: LayoutConfig = LayoutConfig()
-    output: OutputConfig = OutputConfig()
+    layout: LayoutConfig = Field(default_factory=LayoutConfig)
+    output: OutputConfig = Field(default_factory=OutputConfig)
 
     @model_validator(mode="after")
     def validate_font_pairing(self) -> "BuildConfig":
         warnings = validate_script_font_pair(self.quran.script, self.font.arabic)
         if warnings:
             # Store warnings for the CLI to display — don't block the build
-            if not hasattr(self, "_warnings"):
-                object.__setattr__(self, "_warnings", [])
             object.__setattr__(self, "_warnings", warnings)
         return self
 
@@ -93,12 +116,22 @@ class BuildConfig(BaseModel):
     def warnings(self) -> list[str]:
         return getattr(self, "_warnings", [])
 
-    @property
+    @cached_property
     def font_info(self):
         return FONTS.get(self.font.arabic)
 
+    @model_validator(mode="after")
+    def precompute_auto_filename(self) -> "BuildConfig":
+        # The config is read-only after validation, so build the filename once.
+        object.__setattr__(self, "_auto_filename", self._compose_auto_filename())
+        return self
+
     @property
     def auto_filename(self) -> str:
+        """Descriptive filename generated from config settings at load time."""
+        return self._auto_filename
+
+    def _compose_auto_filename(self) -> str:
         """Generate a descriptive filename from config settings.
 
         Pattern: quran_{riwayah}[_{script}]_{font}_{layout}_{lang}[-{translation}][_{gloss}wbw]
@@ -124,12 +157,12 @@ class BuildConfig(BaseModel):
             "quran",
             get_riwayah(self.quran.script),
         ]
-        script_tag = abbreviate("script", self.quran.script)
+        script_tag = ABBREV_SCRIPTS.get(self.quran.script, self.quran.script)
         if script_tag:
             parts.append(script_tag)
         parts.extend([
-            abbreviate("font", self.font.arabic),
-            abbreviate("layout", layout_key),
+            ABBREV_FONTS.get(self.font.arabic, self.font.arabic),
+            ABBREV_LAYOUTS.get(layout_key, layout_key),
             lang,
         ])
 
@@ -141,15 +174,29 @@ class BuildConfig(BaseModel):
 
         return "_".join(p for p in parts if p)
 
-    @property
+    @cached_property
     def output_filename(self) -> str:
         """Resolve the output filename — explicit or auto-generated."""
         return self.output.filename or self.auto_filename
 
 
+# Parsed configs keyed by (resolved path, mtime_ns, size). Configs are
+# read-only after validation, so repeat loads can share one instance.
+_config_cache: dict[tuple[str, int, int], BuildConfig] = {}
+
+
 def load_config(path: str | Path) -> BuildConfig:
-    """Load and validate a build config from a YAML file."""
-    path = Path(path)
-    with path.open() as f:
-        raw = yaml.safe_load(f)
-    return BuildConfig.model_validate(raw or {})
+    """Load and validate a build config from a YAML file.
+
+    Results are memoized per file; an edit (new mtime or size) reloads it.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    config = _config_cache.get(key)
+    if config is None:
+        with path.open() as f:
+            raw = yaml.load(f, Loader=_YAML_LOADER)
+        config = BuildConfig.model_validate(raw or {})
+        _config_cache[key] = config
+    return config
@@ -9,34 +9,80 @@ silently.  Production CI builds run without a pre-populated cache, so they
 always fetch fresh data on the first call and reuse it within the run.
 """
 
+import functools
 import json
+import mmap
+import os
 import re
+import shutil
 import sys
+import threading
 import time
 from pathlib import Path
 
 import click
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is used otherwise
+    orjson = None
+
 # Project root: src/quran_ebook/data/cache.py → 4 levels up
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 DEFAULT_CACHE_DIR = _PROJECT_ROOT / ".cache"
 DEFAULT_TTL_DAYS = 30
+# For data that never changes upstream (Arabic text, chapter metadata,
+# glyph codes): stale prompts would only ever cause needless re-fetches.
+NO_EXPIRY_TTL_DAYS = 365000
 
 # Strip trailing _chNN to group cache keys into categories for prompting.
 _CATEGORY_RE = re.compile(r"_ch\d+$")
 
+# Cache contents owned by the package (see cache_clear): cache_set entries,
+# Tanzil XML downloads, font downloads and Jinja bytecode.
+_TOP_LEVEL_FILE_RE = re.compile(r".+\.json|quran-.+\.xml")
+_PACKAGE_SUBDIRS = ("fonts", "jinja")
+
 # Tracks user decisions per category within a single process.
 # True = re-fetch (return None for stale), False = use stale data.
 _stale_decisions: dict[str, bool] = {}
+# Loaders fetch chapters from a thread pool; serialize prompts so each
+# category is asked about once and prompts don't interleave.
+_stale_lock = threading.Lock()
 
 
+@functools.lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
-    """Get or create the cache directory."""
+    """Get or create the cache directory (created once per process)."""
     cache_dir = DEFAULT_CACHE_DIR
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
 
+def _read_json(path: Path):
+    """Parse a JSON file.
+
+    With orjson, parses straight from a read-only memory map so the file
+    is never copied into a separate bytes buffer.
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _json_dumps(value) -> bytes:
+    """Encode a value as UTF-8 JSON bytes (orjson when available).
+
+    Non-string dict keys (e.g. verse numbers) are stringified, matching
+    stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
 def _cache_category(key: str) -> str:
     """Derive a category from a cache key for grouped staleness prompts."""
     return _CATEGORY_RE.sub("", key)
@@ -53,73 +99,98 @@ def _prompt_stale(key: str, age_days: int) -> bool:
     Only prompts once per category. Non-interactive defaults to reuse.
     """
     category = _cache_category(key)
-    if category in _stale_decisions:
-        return _stale_decisions[category]
-
-    if not _is_interactive():
-        _stale_decisions[category] = False
-        return False
-
-    label = category.replace("_", " ").replace("quran api", "Quran API")
-    answer = click.prompt(
-        f"  {label} cache is {age_days} days old. Re-fetch?",
-        type=click.Choice(["y", "N"], case_sensitive=False),
-        default="N",
-        show_default=True,
-    )
-    refetch = answer.lower() == "y"
-    _stale_decisions[category] = refetch
-    return refetch
+    with _stale_lock:
+        if category in _stale_decisions:
+            return _stale_decisions[category]
+
+        if not _is_interactive():
+            _stale_decisions[category] = False
+            return False
+
+        label = category.replace("_", " ").replace("quran api", "Quran API")
+        answer = click.prompt(
+            f"  {label} cache is {age_days} days old. Re-fetch?",
+            type=click.Choice(["y", "N"], case_sensitive=False),
+            default="N",
+            show_default=True,
+        )
+        refetch = answer.lower() == "y"
+        _stale_decisions[category] = refetch
+        return refetch
 
 
 def cache_get(key: str, ttl_days: int = DEFAULT_TTL_DAYS) -> dict | None:
     """Read a cached JSON value if it exists and hasn't expired.
 
+    The entry's age is its file mtime, so expiry is decided with a single
+    ``stat`` before any JSON is parsed.
+
     When the TTL has elapsed, prompts the user (once per data category)
     to re-fetch or reuse the stale data.  Old cache files are never
     deleted — they are only overwritten by a successful ``cache_set``.
     """
     cache_file = get_cache_dir() / f"{key}.json"
-    if not cache_file.exists():
-        return None
-
     try:
-        data = json.loads(cache_file.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        cache_file.unlink(missing_ok=True)
+        mtime = cache_file.stat().st_mtime
+    except FileNotFoundError:
         return None
 
-    cached_at = data.get("_cached_at", 0)
-    age_seconds = time.time() - cached_at
+    age_seconds = time.time() - mtime
     if age_seconds > ttl_days * 86400:
         age_days = int(age_seconds / 86400)
         if _prompt_stale(key, age_days):
             return None  # caller will re-fetch; old file stays until cache_set
         # user chose to keep stale data
-        return data.get("value")
 
-    return data.get("value")
+    try:
+        data = _read_json(cache_file)
+    except ValueError:  # malformed JSON, invalid UTF-8, or an empty file
+        cache_file.unlink(missing_ok=True)
+        return None
+
+    # Entries written by older versions wrap the value with a timestamp.
+    if isinstance(data, dict) and "_cached_at" in data and "value" in data:
+        return data["value"]
+    return data
 
 
 def cache_set(key: str, value: dict) -> None:
     """Write a value to the cache.
 
     Writes to a temporary file first, then renames — so a failed fetch
-    never corrupts the existing cache entry.
+    never corrupts the existing cache entry.  The temporary name includes
+    the PID so parallel builds writing the same key don't collide.
+    The file's mtime records when the value was cached.
     """
     cache_dir = get_cache_dir()
     cache_file = cache_dir / f"{key}.json"
-    tmp_file = cache_dir / f"{key}.json.tmp"
-    payload = json.dumps({"_cached_at": time.time(), "value": value}, ensure_ascii=False)
-    tmp_file.write_text(payload, encoding="utf-8")
-    tmp_file.rename(cache_file)
+    tmp_file = cache_dir / f"{key}.json.{os.getpid()}.tmp"
+    tmp_file.write_bytes(_json_dumps(value))
+    tmp_file.replace(cache_file)
+    now = time.time()
+    os.utime(cache_file, (now, now))
 
 
 def cache_clear() -> int:
-    """Remove all cached files. Returns count of files removed."""
+    """Remove the package's cached data, fonts and compiled templates.
+
+    Only what the package itself writes is removed: top-level JSON entries,
+    downloaded Tanzil XML, and the fonts/ and jinja/ subdirectories.  The
+    dictionary tools keep their own data under the same root (dictionary/,
+    lanes/, ...), some of it placed by hand, so the root is never removed.
+
+    Returns the count of files removed.
+    """
     cache_dir = get_cache_dir()
     count = 0
-    for f in cache_dir.glob("*.json"):
-        f.unlink()
-        count += 1
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and _TOP_LEVEL_FILE_RE.fullmatch(entry.name):
+                os.unlink(entry.path)
+                count += 1
+    for name in _PACKAGE_SUBDIRS:
+        subdir = cache_dir / name
+        if subdir.is_dir():
+            count += sum(len(filenames) for _, _, filenames in os.walk(subdir))
+            shutil.rmtree(subdir)
     return count
@@ -0,0 +1,99 @@
+"""Shared HTTP client for data loaders.
+
+Loaders talk to a handful of hosts (api.quran.com, qul.tarteel.ai,
+tanzil.net, jsDelivr). Reusing one pooled client keeps connections alive
+across chapters and loaders instead of paying a TCP+TLS handshake per
+client or per one-off ``httpx.get``.
+"""
+
+import atexit
+import importlib.util
+import json
+import os
+import threading
+import warnings
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is used otherwise
+    orjson = None
+
+DEFAULT_TIMEOUT = 30  # seconds; slow endpoints pass a per-request timeout
+
+# Requests issued concurrently by the loaders and font downloads. They are
+# I/O-bound; set QURAN_EBOOK_FETCH_WORKERS lower (e.g. 1) to go easier on
+# the upstream servers.
+_DEFAULT_FETCH_WORKERS = 16
+
+
+def _fetch_workers() -> int:
+    """Read QURAN_EBOOK_FETCH_WORKERS, falling back to the default if invalid."""
+    raw = os.environ.get("QURAN_EBOOK_FETCH_WORKERS")
+    if raw is None:
+        return _DEFAULT_FETCH_WORKERS
+    try:
+        workers = int(raw)
+    except ValueError:
+        warnings.warn(
+            f"Ignoring non-integer QURAN_EBOOK_FETCH_WORKERS={raw!r}; "
+            f"using {_DEFAULT_FETCH_WORKERS}",
+            stacklevel=2,
+        )
+        return _DEFAULT_FETCH_WORKERS
+    return max(1, workers)
+
+
+FETCH_WORKERS = _fetch_workers()
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]").
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+_client: httpx.Client | None = None
+_client_pid: int | None = None
+_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    A fresh client is created after a fork, so worker processes
+    (``build --jobs``) never share connections with their parent.
+    """
+    global _client, _client_pid
+    with _lock:
+        if _client is None or _client_pid != os.getpid():
+            _client = httpx.Client(
+                timeout=DEFAULT_TIMEOUT,
+                follow_redirects=True,
+                http2=_HTTP2,
+                limits=_LIMITS,
+            )
+            _client_pid = os.getpid()
+        return _client
+
+
+def response_json(resp: httpx.Response):
+    """Decode a JSON response body from its raw bytes.
+
+    Skips httpx's charset detection (all sources serve UTF-8 JSON) and
+    uses orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return json.loads(resp.content)
+
+
+def close_client() -> None:
+    """Close the shared client. Registered to run at interpreter exit."""
+    global _client
+    with _lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
+
+
+atexit.register(close_client)
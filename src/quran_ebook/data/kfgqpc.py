@@ -12,10 +12,10 @@ import json
 import re
 
 import click
-import httpx
 
 from ..models import Ayah, Mushaf, Surah
 from .cache import cache_get, cache_set
+from .http_client import get_client, response_json
 
 # jsDelivr CDN base for the GitHub mirror.
 _CDN_BASE = (
@@ -52,9 +52,9 @@ def _fetch_json(riwayah: str) -> list[dict]:
     json_path, _ = _RIWAYAH_FILES[riwayah]
     url = f"{_CDN_BASE}/{json_path}"
     click.echo(f"  Fetching KFGQPC {riwayah} data from CDN...")
-    resp = httpx.get(url, timeout=60, follow_redirects=True)
+    resp = get_client().get(url, timeout=60)
     resp.raise_for_status()
-    data = resp.json()
+    data = response_json(resp)
     cache_set(cache_key, data)
     return data
 
@@ -66,17 +66,19 @@ def _normalize_entry(entry: dict) -> dict:
       Hafs:  sora, sora_name_en, sora_name_ar
       Warsh: sura_no, sura_name_en, sura_name_ar
 
-    Returns a dict with canonical keys.
+    Returns a dict with canonical keys. Numeric fields are converted to
+    int here, since the models do no type coercion.
     """
+    juz = entry.get("jozz")
     return {
-        "surah_number": entry.get("sura_no") or entry.get("sora"),
+        "surah_number": int(entry.get("sura_no") or entry.get("sora")),
         "surah_name_en": entry.get("sura_name_en") or entry.get("sora_name_en", ""),
         "surah_name_ar": (
             (entry.get("sura_name_ar") or entry.get("sora_name_ar", "")).strip()
         ),
-        "ayah_number": entry["aya_no"],
+        "ayah_number": int(entry["aya_no"]),
         "text": entry["aya_text"],
-        "juz": entry.get("jozz"),
+        "juz": int(juz) if juz is not None else None,
         "page": entry.get("page"),
         "line_start": entry.get("line_start"),
         "line_end": entry.get("line_end"),
@@ -14,6 +14,7 @@ import click
 import httpx
 
 from .cache import cache_get, cache_set
+from .http_client import response_json
 
 QUL_BASE_URL = "https://qul.tarteel.ai/api/v1"
 
@@ -68,7 +69,7 @@ def fetch_qul_translation(
         f"{QUL_BASE_URL}/translations/{resource_id}/by_range",
         params={"from": f"{chapter_number}:1", "to": f"{chapter_number}:{total_verses}"},
     )
-    data = resp.json()
+    data = response_json(resp)
 
     result = _parse_qul_response(data, total_verses)
     cache_set(cache_key, result)
@@ -98,7 +99,7 @@ def fetch_qul_tafsir(
         f"{QUL_BASE_URL}/tafsirs/{resource_id}/by_range",
         params={"from": f"{chapter_number}:1", "to": f"{chapter_number}:{total_verses}"},
     )
-    data = resp.json()
+    data = response_json(resp)
 
     result = _parse_qul_response(data, total_verses)
     cache_set(cache_key, result)
@@ -10,12 +10,14 @@ The text uses QPC encoding (U+06E1 sukun, etc.) with inline
 
 import json
 import re
+import sys
 import zipfile
 from pathlib import Path
 
 import click
 
 from ..models import Ayah, Mushaf, Surah
+from .http_client import get_client
 
 # Path to the downloaded QUL resource 87 data
 QUL_TAJWEED_ZIP = Path(__file__).parent.parent.parent.parent / "docs" / "qpc-hafs-tajweed.json.zip"
@@ -96,9 +98,7 @@ def load_quran_qul_tajweed() -> Mushaf:
     # For now, use the quran_api loader's chapter fetch
     from .quran_api import _fetch_chapters
 
-    import httpx
-    with httpx.Client(timeout=30) as client:
-        chapters = _fetch_chapters(client)
+    chapters = _fetch_chapters(get_client())
 
     surahs = []
     for ch in chapters:
@@ -131,7 +131,7 @@ def load_quran_qul_tajweed() -> Mushaf:
             number=ch_num,
             name_arabic=ch["name_arabic"],
             name_transliteration=ch["name_simple"],
-            revelation_type=ch["revelation_place"],
+            revelation_type=sys.intern(ch["revelation_place"]),
             ayah_count=ch["verses_count"],
             ayahs=ayahs,
         ))
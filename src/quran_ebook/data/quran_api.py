@@ -7,17 +7,23 @@ the KFGQPC Uthmanic Hafs font).
 No authentication required for the v4 API.
 """
 
+import functools
 import html
 import json
 import re
+import sys
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import click
 import httpx
 
 from ..models import Ayah, Footnote, Mushaf, Surah, Word
-from .cache import cache_get, cache_set, get_cache_dir
+from .cache import NO_EXPIRY_TTL_DAYS, cache_get, cache_set, get_cache_dir
+from .http_client import FETCH_WORKERS, get_client, response_json
 from .qul_api import fetch_qul_tafsir, fetch_qul_translation
 
 BASE_URL = "https://api.quran.com/api/v4"
@@ -25,6 +31,11 @@ BASE_URL = "https://api.quran.com/api/v4"
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 
+# by_chapter requests ask for the whole chapter in one page. The documented
+# per_page cap is 50; if a response is clamped to it, the next_page loop
+# still collects the rest, so safety limits are sized against the cap.
+_MIN_PER_PAGE = 50
+
 
 def _api_get(client: httpx.Client, url: str, **kwargs) -> httpx.Response:
     """HTTP GET with retry on transient failures."""
@@ -66,7 +77,8 @@ SCRIPT_FIELDS = {
 # QPC scripts append ayah numbers inline as NBSP + Arabic-Indic digits.
 # We strip these since we render ayah numbers ourselves.
 # Note: 2:72 uses a regular space (API data anomaly), so we accept either.
-_QPC_TRAILING_NUMBER = re.compile(r"[\xa0 ][\u0660-\u0669]+$")
+# Stripped with str.rstrip rather than a regex: the number is always a tail.
+_ARABIC_INDIC_DIGITS = "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669"
 
 # QPC text embeds rub al-hizb marker (۞ U+06DE) at the start of hizb
 # boundary ayahs, followed by NBSP. We strip this structural marker since
@@ -77,6 +89,9 @@ _RUB_ALHIZB = re.compile(r"\u06DE\xa0?")
 # Accept optional quotes around the attribute value and optional whitespace.
 _FOOTNOTE_PATTERN = re.compile(r'<sup\s+foot_note=["\']?(\d+)["\']?\s*>(\d+)</sup>')
 
+# Any HTML tag other than <sup>/</sup>; stripped from translation text.
+_NON_FOOTNOTE_TAG = re.compile(r'<(?!/?sup[\s>])/?[a-zA-Z][^>]*>')
+
 
 # IndoPak end-of-ayah mark cluster: last space before ۟ (U+06DF) + trailing marks.
 # Replace the space with NBSP so text-align:justify won't stretch it.
@@ -100,10 +115,16 @@ def _strip_qpc_markers(text: str) -> str:
     renders it correctly, so no stripping/re-adding needed.
     A hair space (U+200A) is added after ۩ to separate it from the ayah number marker.
     """
-    text = _QPC_TRAILING_NUMBER.sub("", text)
-    text = _RUB_ALHIZB.sub("", text)
-    # Add hair space after sajdah sign for minimal separation from ayah marker
-    text = text.replace("\u06E9", "\u06E9\u200A")
+    stripped = text.rstrip(_ARABIC_INDIC_DIGITS)
+    if len(stripped) < len(text) and stripped[-1:] in ("\xa0", " "):
+        text = stripped[:-1]
+    # Rub al-hizb and sajdah marks occur in a few hundred ayahs; a plain
+    # containment check lets every other ayah skip those passes.
+    if "\u06DE" in text:
+        text = _RUB_ALHIZB.sub("", text)
+    if "\u06E9" in text:
+        # Add hair space after sajdah sign for minimal separation from ayah marker
+        text = text.replace("\u06E9", "\u06E9\u200A")
     return text
 
 
@@ -115,7 +136,7 @@ def _fetch_languages(client: httpx.Client) -> list[dict]:
         return cached
 
     resp = _api_get(client, f"{BASE_URL}/resources/languages")
-    languages = resp.json()["languages"]
+    languages = response_json(resp)["languages"]
     cache_set(cache_key, languages)
     return languages
 
@@ -126,6 +147,16 @@ _DIRECTION_OVERRIDES: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _language_directions() -> dict[str, str]:
+    """Map iso_code -> direction, built once per process from the API list."""
+    directions = dict(_DIRECTION_OVERRIDES)
+    for lang in _fetch_languages(get_client()):
+        # First entry wins, matching the original linear scan
+        directions.setdefault(lang.get("iso_code"), lang.get("direction", "ltr"))
+    return directions
+
+
 def get_language_direction(lang_code: str) -> str:
     """Look up text direction for a language from the API.
 
@@ -134,23 +165,18 @@ def get_language_direction(lang_code: str) -> str:
     """
     if lang_code in _DIRECTION_OVERRIDES:
         return _DIRECTION_OVERRIDES[lang_code]
-    with httpx.Client(timeout=30) as client:
-        languages = _fetch_languages(client)
-    for lang in languages:
-        if lang.get("iso_code") == lang_code:
-            return lang.get("direction", "ltr")
-    return "ltr"
+    return _language_directions().get(lang_code, "ltr")
 
 
 def _fetch_chapters(client: httpx.Client) -> list[dict]:
     """Fetch all 114 chapter metadata."""
     cache_key = "quran_api_chapters"
-    cached = cache_get(cache_key)
+    cached = cache_get(cache_key, ttl_days=NO_EXPIRY_TTL_DAYS)
     if cached:
         return cached
 
     resp = _api_get(client, f"{BASE_URL}/chapters")
-    chapters = resp.json()["chapters"]
+    chapters = response_json(resp)["chapters"]
     cache_set(cache_key, chapters)
     return chapters
 
@@ -193,7 +219,7 @@ def _fetch_translated_names(client: httpx.Client, language: str) -> dict[str, st
         return cached
 
     resp = _api_get(client, f"{BASE_URL}/chapters", params={"language": language})
-    chapters = resp.json()["chapters"]
+    chapters = response_json(resp)["chapters"]
 
     # Detect English fallback: API returns English names for unsupported languages
     if language != "en" and chapters:
@@ -223,14 +249,14 @@ def _fetch_verses(
     Returns (verses, from_cache).
     """
     cache_key = f"quran_api_ch{chapter_number}_{script}"
-    cached = cache_get(cache_key)
+    cached = cache_get(cache_key, ttl_days=NO_EXPIRY_TTL_DAYS)
     if cached:
         return cached, True
 
     all_verses = []
     page = 1
-    per_page = 50  # API maximum
-    max_pages = (total_verses // per_page) + 2  # Safety limit
+    per_page = total_verses  # whole chapter in one request
+    max_pages = (total_verses // _MIN_PER_PAGE) + 2  # Safety limit
 
     while len(all_verses) < total_verses:
         if page > max_pages:
@@ -248,7 +274,7 @@ def _fetch_verses(
                 "page": str(page),
             },
         )
-        data = resp.json()
+        data = response_json(resp)
         all_verses.extend(data["verses"])
 
         pagination = data.get("pagination", {})
@@ -256,6 +282,12 @@ def _fetch_verses(
             break
         page += 1
 
+    if len(all_verses) != total_verses:
+        raise RuntimeError(
+            f"Chapter {chapter_number}: expected {total_verses} verses, "
+            f"got {len(all_verses)}"
+        )
+
     cache_set(cache_key, all_verses)
     return all_verses, False
 
@@ -281,7 +313,7 @@ def _fetch_translation(
         client, f"{BASE_URL}/quran/translations/{resource_id}",
         params={"chapter_number": str(chapter_number), "foot_notes": "true"},
     )
-    data = resp.json()
+    data = response_json(resp)
     translations = data.get("translations", [])
 
     result = []
@@ -322,8 +354,8 @@ def _fetch_words(
 
     all_verses = []
     page = 1
-    per_page = 50
-    max_pages = (total_verses // per_page) + 2
+    per_page = total_verses
+    max_pages = (total_verses // _MIN_PER_PAGE) + 2
 
     while len(all_verses) < total_verses:
         if page > max_pages:
@@ -338,7 +370,7 @@ def _fetch_words(
                 "page": str(page),
             },
         )
-        data = resp.json()
+        data = response_json(resp)
         all_verses.extend(data["verses"])
         pagination = data.get("pagination", {})
         if pagination.get("next_page") is None:
@@ -392,14 +424,14 @@ def _fetch_qcf_words(
     Each word_dict has: position, code (glyph string), page_number, text_uthmani.
     """
     cache_key = f"quran_api_qcf_{code_field}_ch{chapter_number}_v2"
-    cached = cache_get(cache_key)
+    cached = cache_get(cache_key, ttl_days=NO_EXPIRY_TTL_DAYS)
     if cached:
         return cached, True
 
     all_verses = []
     page = 1
-    per_page = 50
-    max_pages = (total_verses // per_page) + 2
+    per_page = total_verses
+    max_pages = (total_verses // _MIN_PER_PAGE) + 2
 
     while len(all_verses) < total_verses:
         if page > max_pages:
@@ -414,7 +446,7 @@ def _fetch_qcf_words(
                 "page": str(page),
             },
         )
-        data = resp.json()
+        data = response_json(resp)
         all_verses.extend(data["verses"])
         pagination = data.get("pagination", {})
         if pagination.get("next_page") is None:
@@ -442,6 +474,32 @@ def _fetch_qcf_words(
     return result, False
 
 
+def _iter_chapter_fetches(
+    chapters: list[dict],
+    submit_chapter: Callable[[ThreadPoolExecutor, dict], tuple[Future | None, ...]],
+) -> Iterator[tuple[dict, tuple[Future | None, ...]]]:
+    """Yield ``(chapter, futures)`` in chapter order from a sliding window.
+
+    Chapters, and each chapter's requests, are independent, but submitting
+    all 114 up front would hold every chapter's raw API data until the
+    whole Mushaf is assembled. Only FETCH_WORKERS chapters are kept in
+    flight; the next one is submitted as each is handed to the caller.
+    """
+    remaining = iter(chapters)
+    window: deque[tuple[dict, tuple[Future | None, ...]]] = deque()
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        for ch in remaining:
+            window.append((ch, submit_chapter(pool, ch)))
+            if len(window) >= FETCH_WORKERS:
+                break
+        while window:
+            chapter_futures = window.popleft()
+            ch = next(remaining, None)
+            if ch is not None:
+                window.append((ch, submit_chapter(pool, ch)))
+            yield chapter_futures
+
+
 def load_quran_qcf(
     script: str = "qcf_v4_tajweed",
     translation_id: int | None = None,
@@ -457,135 +515,130 @@ def load_quran_qcf(
     """
     code_field = "code_v1" if "v1" in script else "code_v2"
 
-    with httpx.Client(timeout=30) as client:
-        cache_dir = get_cache_dir()
-        click.echo(f"Loading QCF Quran data (cache: {cache_dir})")
-        chapters = _fetch_chapters(client)
+    client = get_client()
+    cache_dir = get_cache_dir()
+    click.echo(f"Loading QCF Quran data (cache: {cache_dir})")
+    chapters = _fetch_chapters(client)
 
-        translated_names: dict[str, str] = {}
-        if translation_language:
-            translated_names = _fetch_translated_names(client, translation_language)
+    translated_names: dict[str, str] = {}
+    if translation_language:
+        translated_names = _fetch_translated_names(client, translation_language)
 
-        cached_count = 0
-        fetched_count = 0
-        trans_cached = 0
-        trans_fetched = 0
-        surahs = []
+    cached_count = 0
+    fetched_count = 0
+    trans_cached = 0
+    trans_fetched = 0
+    surahs = []
 
-        for ch in chapters:
-            ch_num = ch["id"]
-            ch_name = ch["name_simple"]
+    def submit_chapter(pool: ThreadPoolExecutor, ch: dict) -> tuple[Future, ...]:
+        return (
+            pool.submit(
+                _fetch_qcf_words, client, ch["id"], ch["verses_count"],
+                code_field=code_field,
+            ),
+            # Verse-level data for page_number/juz/hizb metadata
+            pool.submit(
+                _fetch_verses, client, ch["id"], "qpc_uthmani_hafs", ch["verses_count"]
+            ),
+            pool.submit(
+                _fetch_chapter_translation,
+                client, ch, translation_source, translation_id, translation_edition,
+            ),
+        )
 
-            qcf_data, from_cache = _fetch_qcf_words(
-                client, ch_num, ch["verses_count"], code_field=code_field
-            )
-            if from_cache:
-                cached_count += 1
-            else:
-                fetched_count += 1
-                click.echo(f"  Fetched QCF surah {ch_num}/114: {ch_name}")
-
-            # Fetch verse-level data for page_number/juz/hizb metadata
-            raw_verses, _ = _fetch_verses(client, ch_num, "qpc_uthmani_hafs", ch["verses_count"])
-
-            # Fetch translation if requested
-            trans_data = None
-            trans_from_cache = True
-            if translation_source == "local" and translation_edition:
-                trans_data, trans_from_cache = _load_local_translation(ch_num, translation_edition)
-            elif translation_source == "fawazahmed0" and translation_edition:
-                trans_data, trans_from_cache = _fetch_fawazahmed0_translation(
-                    client, ch_num, translation_edition
-                )
-            elif translation_source == "qul" and translation_id is not None:
-                trans_data, trans_from_cache = fetch_qul_translation(
-                    client, ch_num, translation_id, ch["verses_count"]
-                )
-            elif translation_source == "qul_tafsir" and translation_id is not None:
-                trans_data, trans_from_cache = fetch_qul_tafsir(
-                    client, ch_num, translation_id, ch["verses_count"]
-                )
-            elif translation_id is not None:
-                trans_data, trans_from_cache = _fetch_translation(client, ch_num, translation_id)
+    # Each chapter's raw API data is dropped once its Surah has been built.
+    for ch, futures in _iter_chapter_fetches(chapters, submit_chapter):
+        chapter_data = tuple(f.result() for f in futures)
+        ch_num = ch["id"]
+        ch_name = ch["name_simple"]
+        (qcf_data, from_cache), (raw_verses, _), (trans_data, trans_from_cache) = chapter_data
 
-            if trans_data is not None:
-                if trans_from_cache:
-                    trans_cached += 1
-                else:
-                    trans_fetched += 1
+        if from_cache:
+            cached_count += 1
+        else:
+            fetched_count += 1
+            click.echo(f"  Fetched QCF surah {ch_num}/114: {ch_name}")
 
-            ayahs = []
-            for i, v in enumerate(raw_verses):
-                verse_num = v["verse_number"]
-                has_hizb = "\u06DE" in v.get("qpc_uthmani_hafs", "")
-
-                translation = None
-                footnotes = []
-                if trans_data and i < len(trans_data):
-                    td = trans_data[i]
-                    translation, footnotes = _process_translation_text(
-                        td["text"], td.get("foot_notes", {}), ch_num
-                    )
-
-                # Build Word objects from QCF data
-                words = []
-                verse_words = qcf_data.get(verse_num, qcf_data.get(str(verse_num), []))
-                for wd in verse_words:
-                    code = wd["code"]
-                    text = wd["text_uthmani"]
-                    # Strip font's rub al-hizb glyph from position 1 of hizb-boundary ayahs.
-                    # The API bakes it as an extra glyph: "ﱨ ﱩ" (rub + space + word).
-                    # We render our own hizb marker from Scheherazade instead.
-                    if has_hizb and wd["position"] == 1 and " " in code:
-                        code = code.split(" ", 1)[1]
-                        text = text.lstrip("\u06DE").lstrip()
-                    words.append(Word(
-                        position=wd["position"],
-                        text=text,
-                        code_v2=code,
-                        page_number=wd["page_number"],
-                        line_number=wd.get("line_number"),
-                        char_type=wd.get("char_type", "word"),
-                    ))
+        if trans_data is not None:
+            if trans_from_cache:
+                trans_cached += 1
+            else:
+                trans_fetched += 1
+
+        ayahs = []
+        for i, v in enumerate(raw_verses):
+            verse_num = v["verse_number"]
+            has_hizb = "\u06DE" in v.get("qpc_uthmani_hafs", "")
+
+            translation = None
+            footnotes = []
+            if trans_data and i < len(trans_data):
+                td = trans_data[i]
+                translation, footnotes = _process_translation_text(
+                    td["text"], td.get("foot_notes", {}), ch_num
+                )
 
-                # Ayah text = concatenated glyph codes (for fallback display)
-                ayah_text = " ".join(wd["code"] for wd in verse_words)
-
-                ayahs.append(Ayah(
-                    surah_number=ch_num,
-                    ayah_number=verse_num,
-                    text=ayah_text,
-                    page_number=v.get("page_number"),
-                    juz_number=v.get("juz_number"),
-                    hizb_quarter=v.get("rub_el_hizb_number"),
-                    sajdah=v.get("sajdah_number") is not None,
-                    hizb_marker=has_hizb,
-                    translation=translation,
-                    footnotes=footnotes,
-                    words=words,
+            # Build Word objects from QCF data
+            words = []
+            verse_words = qcf_data.get(verse_num, qcf_data.get(str(verse_num), []))
+            for wd in verse_words:
+                code = wd["code"]
+                text = wd["text_uthmani"]
+                # Strip font's rub al-hizb glyph from position 1 of hizb-boundary ayahs.
+                # The API bakes it as an extra glyph: "ﱨ ﱩ" (rub + space + word).
+                # We render our own hizb marker from Scheherazade instead.
+                if has_hizb and wd["position"] == 1 and " " in code:
+                    code = code.split(" ", 1)[1]
+                    text = text.lstrip("\u06DE").lstrip()
+                words.append(Word(
+                    position=wd["position"],
+                    text=text,
+                    code_v2=code,
+                    page_number=wd["page_number"],
+                    line_number=wd.get("line_number"),
+                    # Each decoded JSON string is its own object; interning
+                    # shares one "word"/"end" across ~80k words.
+                    char_type=sys.intern(wd.get("char_type", "word")),
                 ))
 
-            surahs.append(Surah(
-                number=ch_num,
-                name_arabic=ch["name_arabic"],
-                name_transliteration=ch["name_simple"],
-                name_translation=_dedup_translated_name(
-                    _sanitize_api_html(translated_names.get(str(ch_num), "")),
-                    ch["name_simple"],
-                ),
-                revelation_type=ch["revelation_place"],
-                ayah_count=ch["verses_count"],
-                ayahs=ayahs,
+            # Ayah text = concatenated glyph codes (for fallback display)
+            ayah_text = " ".join(wd["code"] for wd in verse_words)
+
+            ayahs.append(Ayah(
+                surah_number=ch_num,
+                ayah_number=verse_num,
+                text=ayah_text,
+                page_number=v.get("page_number"),
+                juz_number=v.get("juz_number"),
+                hizb_quarter=v.get("rub_el_hizb_number"),
+                sajdah=v.get("sajdah_number") is not None,
+                hizb_marker=has_hizb,
+                translation=translation,
+                footnotes=footnotes,
+                words=words,
             ))
 
-        if fetched_count:
-            click.echo(f"  QCF: {cached_count} cached, {fetched_count} fetched from API")
-        else:
-            click.echo(f"  QCF: all {cached_count} surahs loaded from cache")
-        if trans_fetched:
-            click.echo(f"  Translation: {trans_cached} cached, {trans_fetched} fetched from API")
-        elif trans_cached:
-            click.echo(f"  Translation: all {trans_cached} surahs loaded from cache")
+        surahs.append(Surah(
+            number=ch_num,
+            name_arabic=ch["name_arabic"],
+            name_transliteration=ch["name_simple"],
+            name_translation=_dedup_translated_name(
+                _sanitize_api_html(translated_names.get(str(ch_num), "")),
+                ch["name_simple"],
+            ),
+            revelation_type=sys.intern(ch["revelation_place"]),
+            ayah_count=ch["verses_count"],
+            ayahs=ayahs,
+        ))
+
+    if fetched_count:
+        click.echo(f"  QCF: {cached_count} cached, {fetched_count} fetched from API")
+    else:
+        click.echo(f"  QCF: all {cached_count} surahs loaded from cache")
+    if trans_fetched:
+        click.echo(f"  Translation: {trans_cached} cached, {trans_fetched} fetched from API")
+    elif trans_cached:
+        click.echo(f"  Translation: all {trans_cached} surahs loaded from cache")
 
     # QCF doesn't have a simple bismillah text — it's composed of glyph codes
     # from the first ayah's words. Store the uthmani bismillah for metadata.
@@ -621,7 +674,7 @@ def _fetch_fawazahmed0_translation(
         return cached, True
 
     resp = _api_get(client, f"{FAWAZAHMED0_CDN}/{edition}/{chapter_number}.json")
-    data = resp.json()
+    data = response_json(resp)
 
     result = []
     for verse in data.get("chapter", []):
@@ -648,7 +701,7 @@ def _load_local_translation(chapter_number: int, edition: str) -> tuple[list[dic
 
     # Fall back to cache
     cache_key = f"local_{edition}_ch{chapter_number}"
-    cached = cache_get(cache_key, ttl_days=365000)
+    cached = cache_get(cache_key, ttl_days=NO_EXPIRY_TTL_DAYS)
     if cached is None:
         raise FileNotFoundError(
             f"No local translation data for '{edition}' chapter {chapter_number}. "
@@ -657,6 +710,32 @@ def _load_local_translation(chapter_number: int, edition: str) -> tuple[list[dic
     return cached, True
 
 
+def _fetch_chapter_translation(
+    client: httpx.Client,
+    ch: dict,
+    translation_source: str,
+    translation_id: int | None,
+    translation_edition: str,
+) -> tuple[list[dict] | None, bool]:
+    """Fetch one chapter's translation from the configured source.
+
+    Returns (verses, from_cache); verses is None when no translation
+    is configured.
+    """
+    ch_num = ch["id"]
+    if translation_source == "local" and translation_edition:
+        return _load_local_translation(ch_num, translation_edition)
+    if translation_source == "fawazahmed0" and translation_edition:
+        return _fetch_fawazahmed0_translation(client, ch_num, translation_edition)
+    if translation_source == "qul" and translation_id is not None:
+        return fetch_qul_translation(client, ch_num, translation_id, ch["verses_count"])
+    if translation_source == "qul_tafsir" and translation_id is not None:
+        return fetch_qul_tafsir(client, ch_num, translation_id, ch["verses_count"])
+    if translation_id is not None:
+        return _fetch_translation(client, ch_num, translation_id)
+    return None, True
+
+
 def _sanitize_api_html(text: str) -> str:
     """Strip all HTML tags and escape for valid XHTML.
 
@@ -698,40 +777,40 @@ def _process_translation_text(
         - processed_text: Translation with <sup> replaced by EPUB3 noteref links
         - footnotes_list: List of Footnote objects for endnote rendering
     """
-    footnotes = []
+    # Fix upstream data corruption: some translations (e.g. Maududi en)
+    # have U+FFFD replacement characters where em-dashes should be.
+    text = text.replace('\ufffd', '\u2014')
+    # Most verses carry no markup at all: skip both regex scans.
+    if '<' not in text:
+        return _escape_xml(text), []
+    # Strip non-footnote HTML tags, keep <sup foot_note=...>...</sup> for replacement.
+    text = _NON_FOOTNOTE_TAG.sub('', text)
 
-    def _replace_footnote(match):
-        fn_id = match.group(1)
-        fn_num = match.group(2)
-        fn_text = foot_notes.get(fn_id, foot_notes.get(str(fn_id), ""))
-        fn_text = _sanitize_api_html(fn_text)
+    # Escape the text between footnote <sup> tags and replace each tag with
+    # an EPUB3 noteref, in a single scan.
+    footnotes = []
+    parts = []
+    pos = 0
+    for match in _FOOTNOTE_PATTERN.finditer(text):
+        parts.append(_escape_xml(text[pos:match.start()]))
+        fn_id, fn_num = match.groups()
+        fn_text = _sanitize_api_html(foot_notes.get(fn_id, ""))
         footnotes.append(Footnote(id=int(fn_id), number=int(fn_num), text=fn_text))
-        return (
+        parts.append(
             f'<a epub:type="noteref" href="endnotes.xhtml#fn-{fn_id}" class="noteref">'
             f'{fn_num}</a>'
         )
+        pos = match.end()
+    parts.append(_escape_xml(text[pos:]))
+    return "".join(parts), footnotes
 
-    # Fix upstream data corruption: some translations (e.g. Maududi en)
-    # have U+FFFD replacement characters where em-dashes should be.
-    text = text.replace('\ufffd', '\u2014')
-    # Strip non-footnote HTML tags, keep <sup foot_note=...>...</sup> for replacement.
-    text = re.sub(r'<(?!/?sup[\s>])/?[a-zA-Z][^>]*>', '', text)
-    # Save footnote <sup> tags as placeholders before escaping.
-    saved_sups: list[str] = []
-    def _save_sup(m: re.Match) -> str:
-        saved_sups.append(m.group(0))
-        return f'\x00FN{len(saved_sups) - 1}\x00'
-    text = _FOOTNOTE_PATTERN.sub(_save_sup, text)
-    # Escape all XML special characters (bare &, stray < and >).
-    # Some translations (e.g. Uyghur) use <angle brackets> around non-Latin words.
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    # Restore footnote <sup> tags and replace with EPUB3 noterefs.
-    for i, sup in enumerate(saved_sups):
-        text = text.replace(f'\x00FN{i}\x00', sup)
-    processed = _FOOTNOTE_PATTERN.sub(_replace_footnote, text)
-    return processed, footnotes
+
+def _escape_xml(text: str) -> str:
+    """Escape XML special characters (bare &, stray < and >).
+
+    Some translations (e.g. Uyghur) use <angle brackets> around non-Latin words.
+    """
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
 
 
 def load_quran(
@@ -770,140 +849,153 @@ def load_quran(
             f"Unknown script '{script}'. Available: {', '.join(sorted(SCRIPT_FIELDS))}"
         )
 
-    is_qpc = script.startswith("qpc_") or script.startswith("text_qpc_")
+    # Per-script text cleanup, chosen once instead of re-tested for every ayah
+    clean_text = None
+    if script.startswith("qpc_") or script.startswith("text_qpc_"):
+        clean_text = _strip_qpc_markers
+    elif script.startswith("text_indopak"):
+        clean_text = _fix_indopak_spacing
+
+    client = get_client()
+    cache_dir = get_cache_dir()
+    click.echo(f"Loading Quran data (cache: {cache_dir})")
+
+    # A completed load is also cached whole, so warm runs read one file
+    # instead of hundreds of per-chapter entries. Local translations are
+    # edited in-tree, so those builds always take the per-chapter path.
+    full_key = None
+    if translation_source != "local":
+        full_key = (
+            f"quran_full_{script}_{translation_source}_"
+            f"{translation_id or translation_edition or 'none'}_"
+            f"{translation_language or 'none'}_{wbw_language or 'none'}_v1"
+        )
+        cached = cache_get(full_key)
+        if cached:
+            click.echo("  All surahs loaded from cache")
+            return Mushaf.from_dict(cached)
+
+    chapters = _fetch_chapters(client)
+
+    translated_names: dict[str, str] = {}
+    if translation_language:
+        translated_names = _fetch_translated_names(client, translation_language)
+
+    cached_count = 0
+    fetched_count = 0
+    trans_cached = 0
+    trans_fetched = 0
+    surahs = []
 
-    with httpx.Client(timeout=30) as client:
-        cache_dir = get_cache_dir()
-        click.echo(f"Loading Quran data (cache: {cache_dir})")
-        chapters = _fetch_chapters(client)
-
-        translated_names: dict[str, str] = {}
-        if translation_language:
-            translated_names = _fetch_translated_names(client, translation_language)
-
-        cached_count = 0
-        fetched_count = 0
-        trans_cached = 0
-        trans_fetched = 0
-        surahs = []
-        for ch in chapters:
-            ch_num = ch["id"]
-            ch_name = ch["name_simple"]
-
-            raw_verses, from_cache = _fetch_verses(client, ch_num, script, ch["verses_count"])
-            if from_cache:
-                cached_count += 1
+    def submit_chapter(pool: ThreadPoolExecutor, ch: dict) -> tuple[Future | None, ...]:
+        return (
+            pool.submit(_fetch_verses, client, ch["id"], script, ch["verses_count"]),
+            pool.submit(
+                _fetch_chapter_translation,
+                client, ch, translation_source, translation_id, translation_edition,
+            ),
+            pool.submit(
+                _fetch_words, client, ch["id"], wbw_language, ch["verses_count"],
+                script=script,
+            ) if wbw_language else None,
+        )
+
+    # Each chapter's raw API data is dropped once its Surah has been built.
+    for ch, futures in _iter_chapter_fetches(chapters, submit_chapter):
+        # Word-by-word data only when requested: (None, True) = nothing fetched
+        chapter_data = tuple(f.result() if f else (None, True) for f in futures)
+        ch_num = ch["id"]
+        ch_name = ch["name_simple"]
+        (
+            (raw_verses, from_cache),
+            (trans_data, trans_from_cache),
+            (words_data, wbw_from_cache),
+        ) = chapter_data
+
+        if from_cache:
+            cached_count += 1
+        else:
+            fetched_count += 1
+            click.echo(f"  Fetched surah {ch_num}/114: {ch_name}")
+
+        if trans_data is not None:
+            if trans_from_cache:
+                trans_cached += 1
             else:
-                fetched_count += 1
-                click.echo(f"  Fetched surah {ch_num}/114: {ch_name}")
-
-            # Fetch translation if requested
-            trans_data = None
-            trans_from_cache = True
-            if translation_source == "local" and translation_edition:
-                trans_data, trans_from_cache = _load_local_translation(ch_num, translation_edition)
-            elif translation_source == "fawazahmed0" and translation_edition:
-                trans_data, trans_from_cache = _fetch_fawazahmed0_translation(
-                    client, ch_num, translation_edition
+                trans_fetched += 1
+
+        if not wbw_from_cache:
+            click.echo(f"  Fetched WBW words for surah {ch_num}/114: {ch_name}")
+
+        ayahs = []
+        for i, v in enumerate(raw_verses):
+            text = v.get(script, "")
+            has_hizb = "\u06DE" in text
+            if clean_text is not None:
+                text = clean_text(text)
+
+            translation = None
+            footnotes = []
+            if trans_data and i < len(trans_data):
+                td = trans_data[i]
+                translation, footnotes = _process_translation_text(
+                    td["text"], td.get("foot_notes", {}), ch_num
                 )
-            elif translation_source == "qul" and translation_id is not None:
-                trans_data, trans_from_cache = fetch_qul_translation(
-                    client, ch_num, translation_id, ch["verses_count"]
-                )
-            elif translation_source == "qul_tafsir" and translation_id is not None:
-                trans_data, trans_from_cache = fetch_qul_tafsir(
-                    client, ch_num, translation_id, ch["verses_count"]
-                )
-            elif translation_id is not None:
-                trans_data, trans_from_cache = _fetch_translation(client, ch_num, translation_id)
-
-            if trans_data is not None:
-                if trans_from_cache:
-                    trans_cached += 1
-                else:
-                    trans_fetched += 1
-
-            # Fetch word-by-word data if requested
-            words_data: dict[int, list[dict]] | None = None
-            if wbw_language:
-                words_data, wbw_from_cache = _fetch_words(
-                    client, ch_num, wbw_language, ch["verses_count"],
-                    script=script,
-                )
-                if not wbw_from_cache:
-                    click.echo(f"  Fetched WBW words for surah {ch_num}/114: {ch_name}")
 
-            ayahs = []
-            for i, v in enumerate(raw_verses):
-                text = v.get(script, "")
-                has_hizb = "\u06DE" in text
-                if is_qpc:
-                    text = _strip_qpc_markers(text)
-                if script.startswith("text_indopak"):
-                    text = _fix_indopak_spacing(text)
-
-                translation = None
-                footnotes = []
-                if trans_data and i < len(trans_data):
-                    td = trans_data[i]
-                    translation, footnotes = _process_translation_text(
-                        td["text"], td.get("foot_notes", {}), ch_num
-                    )
-
-                # Build Word objects from WBW data
-                # Cache stores keys as strings (JSON serialization)
-                words = []
-                if words_data:
-                    verse_num = v["verse_number"]
-                    for wd in words_data.get(verse_num, words_data.get(str(verse_num), [])):
-                        words.append(Word(
-                            position=wd["position"],
-                            text=wd.get("text", wd.get("text_uthmani", "")),
-                            translation=wd.get("translation", ""),
-                            transliteration=wd.get("transliteration", ""),
-                        ))
-
-                ayahs.append(Ayah(
-                    surah_number=ch_num,
-                    ayah_number=v["verse_number"],
-                    text=text,
-                    page_number=v.get("page_number"),  # V1 (1405 AH) page mapping
-                    juz_number=v.get("juz_number"),
-                    hizb_quarter=v.get("rub_el_hizb_number"),
-                    sajdah=v.get("sajdah_number") is not None,
-                    hizb_marker=has_hizb,
-                    translation=translation,
-                    footnotes=footnotes,
-                    words=words,
-                ))
+            # Build Word objects from WBW data
+            # Cache stores keys as strings (JSON serialization)
+            words = []
+            if words_data:
+                verse_num = v["verse_number"]
+                for wd in words_data.get(verse_num, words_data.get(str(verse_num), [])):
+                    words.append(Word(
+                        position=wd["position"],
+                        text=wd.get("text", wd.get("text_uthmani", "")),
+                        translation=wd.get("translation", ""),
+                        transliteration=wd.get("transliteration", ""),
+                    ))
 
-            surahs.append(Surah(
-                number=ch_num,
-                name_arabic=ch["name_arabic"],
-                name_transliteration=ch["name_simple"],
-                name_translation=_dedup_translated_name(
-                    _sanitize_api_html(translated_names.get(str(ch_num), "")),
-                    ch["name_simple"],
-                ),
-                revelation_type=ch["revelation_place"],
-                ayah_count=ch["verses_count"],
-                ayahs=ayahs,
+            ayahs.append(Ayah(
+                surah_number=ch_num,
+                ayah_number=v["verse_number"],
+                text=text,
+                page_number=v.get("page_number"),  # V1 (1405 AH) page mapping
+                juz_number=v.get("juz_number"),
+                hizb_quarter=v.get("rub_el_hizb_number"),
+                sajdah=v.get("sajdah_number") is not None,
+                hizb_marker=has_hizb,
+                translation=translation,
+                footnotes=footnotes,
+                words=words,
             ))
 
-        if fetched_count:
-            click.echo(f"  Arabic: {cached_count} cached, {fetched_count} fetched from API")
-        else:
-            click.echo(f"  Arabic: all {cached_count} surahs loaded from cache")
-        if trans_fetched:
-            click.echo(f"  Translation: {trans_cached} cached, {trans_fetched} fetched from API")
-        elif trans_cached:
-            click.echo(f"  Translation: all {trans_cached} surahs loaded from cache")
+        surahs.append(Surah(
+            number=ch_num,
+            name_arabic=ch["name_arabic"],
+            name_transliteration=ch["name_simple"],
+            name_translation=_dedup_translated_name(
+                _sanitize_api_html(translated_names.get(str(ch_num), "")),
+                ch["name_simple"],
+            ),
+            revelation_type=sys.intern(ch["revelation_place"]),
+            ayah_count=ch["verses_count"],
+            ayahs=ayahs,
+        ))
+
+    if fetched_count:
+        click.echo(f"  Arabic: {cached_count} cached, {fetched_count} fetched from API")
+    else:
+        click.echo(f"  Arabic: all {cached_count} surahs loaded from cache")
+    if trans_fetched:
+        click.echo(f"  Translation: {trans_cached} cached, {trans_fetched} fetched from API")
+    elif trans_cached:
+        click.echo(f"  Translation: all {trans_cached} surahs loaded from cache")
 
     # Al-Fatiha ayah 1 IS the basmala, in the correct script encoding.
     # Use it for all other surahs' bismillah to ensure font compatibility.
     bismillah = surahs[0].ayahs[0].text
 
-    return Mushaf(
+    mushaf = Mushaf(
         surahs=surahs,
         script=script,
         bismillah_text=bismillah,
@@ -912,3 +1004,6 @@ def load_quran(
             "api_version": "v4",
         },
     )
+    if full_key:
+        cache_set(full_key, mushaf.to_dict())
+    return mushaf
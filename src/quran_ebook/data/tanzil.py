@@ -4,13 +4,15 @@ Downloads and parses Uthmani text from Tanzil.net in XML format.
 Source: https://tanzil.net/ (CC-BY 3.0)
 """
 
+import os
 import xml.etree.ElementTree as ET
+from pathlib import Path
 
 import click
-import httpx
 
 from ..models import Ayah, Mushaf, Surah
-from .cache import cache_get, cache_set, get_cache_dir
+from .cache import get_cache_dir
+from .http_client import get_client
 
 TANZIL_URL = "https://tanzil.net/pub/download/index.php"
 
@@ -140,62 +142,78 @@ SAJDAH_AYAHS: set[tuple[int, int]] = {
     (53, 62), (84, 21), (96, 19),
 }
 
+# Same data grouped by surah, so the parser can look up each surah's set once.
+SAJDAH_BY_SURAH: dict[int, frozenset[int]] = {
+    surah: frozenset(a for s, a in SAJDAH_AYAHS if s == surah)
+    for surah in {s for s, _ in SAJDAH_AYAHS}
+}
+
 
-def _download_xml(quran_type: str = "uthmani") -> str:
-    """Download Quran XML from Tanzil.net."""
-    cache_key = f"tanzil_{quran_type}_xml"
-    cached = cache_get(cache_key)
-    if cached:
-        return cached["xml"]
+def _download_xml(quran_type: str = "uthmani") -> Path:
+    """Download Quran XML from Tanzil.net, returning the local file path.
 
-    # Check if we have it saved locally already
+    The response is streamed straight to disk; once saved, the file is
+    reused as-is on later runs.
+    """
     local_path = get_cache_dir() / f"quran-{quran_type}.xml"
     if local_path.exists():
-        xml_text = local_path.read_text(encoding="utf-8")
-    else:
-        click.echo(f"Downloading Quran text from Tanzil.net ({quran_type})...")
-        resp = httpx.get(
-            TANZIL_URL,
-            params={"quranType": quran_type, "outType": "xml"},
-            follow_redirects=True,
-            timeout=60,
-        )
+        return local_path
+
+    click.echo(f"Downloading Quran text from Tanzil.net ({quran_type})...")
+    tmp_path = local_path.with_name(f"{local_path.name}.{os.getpid()}.tmp")
+    with get_client().stream(
+        "GET",
+        TANZIL_URL,
+        params={"quranType": quran_type, "outType": "xml"},
+        timeout=60,
+    ) as resp:
         resp.raise_for_status()
-        xml_text = resp.text
-        local_path.write_text(xml_text, encoding="utf-8")
+        with tmp_path.open("wb") as f:
+            for chunk in resp.iter_bytes(65536):
+                f.write(chunk)
+    tmp_path.replace(local_path)
+    return local_path
 
-    cache_set(cache_key, {"xml": xml_text})
-    return xml_text
 
+def _parse_xml(path: Path) -> list[Surah]:
+    """Parse Tanzil XML into Surah models.
 
-def _parse_xml(xml_text: str) -> list[Surah]:
-    """Parse Tanzil XML into Surah models."""
-    root = ET.fromstring(xml_text)
+    Streams the document with iterparse and clears each element once it
+    has been turned into a model, so the full DOM is never held in memory.
+    """
     surahs = []
-
-    for sura_elem in root.findall("sura"):
-        sura_idx = int(sura_elem.get("index"))
-        name_arabic = sura_elem.get("name")
-        meta = SURAH_META.get(sura_idx, (f"Surah {sura_idx}", "unknown"))
-
-        ayahs = []
-        for aya_elem in sura_elem.findall("aya"):
-            aya_idx = int(aya_elem.get("index"))
+    ayahs: list[Ayah] = []
+    sura_idx = 0
+    sajdah_set: frozenset[int] = frozenset()
+
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "sura":
+                sura_idx = int(elem.get("index"))
+                sajdah_set = SAJDAH_BY_SURAH.get(sura_idx, frozenset())
+                ayahs = []
+            continue
+
+        if elem.tag == "aya":
+            aya_idx = int(elem.get("index"))
             ayahs.append(Ayah(
                 surah_number=sura_idx,
                 ayah_number=aya_idx,
-                text=aya_elem.get("text"),
-                sajdah=(sura_idx, aya_idx) in SAJDAH_AYAHS,
+                text=elem.get("text"),
+                sajdah=aya_idx in sajdah_set,
             ))
-
-        surahs.append(Surah(
-            number=sura_idx,
-            name_arabic=name_arabic,
-            name_transliteration=meta[0],
-            revelation_type=meta[1],
-            ayah_count=len(ayahs),
-            ayahs=ayahs,
-        ))
+            elem.clear()
+        elif elem.tag == "sura":
+            meta = SURAH_META.get(sura_idx, (f"Surah {sura_idx}", "unknown"))
+            surahs.append(Surah(
+                number=sura_idx,
+                name_arabic=elem.get("name"),
+                name_transliteration=meta[0],
+                revelation_type=meta[1],
+                ayah_count=len(ayahs),
+                ayahs=ayahs,
+            ))
+            elem.clear()
 
     return surahs
 
@@ -209,8 +227,7 @@ def load_quran(quran_type: str = "uthmani") -> Mushaf:
     Returns:
         A Mushaf containing all 114 surahs.
     """
-    xml_text = _download_xml(quran_type)
-    surahs = _parse_xml(xml_text)
+    surahs = _parse_xml(_download_xml(quran_type))
 
     script_map = {
         "uthmani": "text_uthmani",
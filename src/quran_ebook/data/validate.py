@@ -7,6 +7,8 @@ Supports multiple riwayat — ayah counts and basmala handling differ
 between readings (Hafs: 6,236 ayahs; Warsh: 6,214; etc.).
 """
 
+import re
+
 import click
 
 from ..config.registry import get_riwayah
@@ -56,10 +58,10 @@ AYAH_COUNTS_WARSH = {
     107: 6, 108: 3, 109: 6, 110: 3, 111: 5, 112: 4, 113: 5, 114: 6,
 }
 
-# Map riwayah → (ayah_counts_dict, expected_total)
-_RIWAYAH_AYAH_DATA: dict[str, tuple[dict[int, int], int]] = {
-    "hafs": (AYAH_COUNTS_HAFS, 6236),
-    "warsh": (AYAH_COUNTS_WARSH, 6214),
+# Map riwayah → (ayah counts indexed by surah number - 1, expected_total)
+_RIWAYAH_AYAH_DATA: dict[str, tuple[tuple[int, ...], int]] = {
+    "hafs": (tuple(AYAH_COUNTS_HAFS[n] for n in range(1, 115)), 6236),
+    "warsh": (tuple(AYAH_COUNTS_WARSH[n] for n in range(1, 115)), 6214),
 }
 
 # Riwayat where 1:1 is NOT the basmala (basmala is unnumbered).
@@ -72,6 +74,9 @@ _FORBIDDEN_IN_QPC = {
     0x06DE: "RUB AL-HIZB MARK (should be stripped by pipeline)",
 }
 
+# One character class over all forbidden codepoints: a single scan per ayah.
+_FORBIDDEN_RE = re.compile("[" + "".join(re.escape(chr(cp)) for cp in _FORBIDDEN_IN_QPC) + "]")
+
 # Madinah Mushaf page range (same for all KFGQPC riwayat)
 _MIN_PAGE = 1
 _MAX_PAGE = 604
@@ -90,15 +95,6 @@ def validate_mushaf(mushaf: Mushaf) -> list[str]:
 
     Returns a list of error messages. Empty list = all checks passed.
     """
-    errors = []
-    errors.extend(_check_surah_count(mushaf))
-    errors.extend(_check_surah_ordering(mushaf))
-    errors.extend(_check_ayah_counts(mushaf))
-    errors.extend(_check_ayah_sequencing(mushaf))
-    errors.extend(_check_empty_text(mushaf))
-    errors.extend(_check_page_numbers(mushaf))
-    errors.extend(_check_bismillah(mushaf))
-
     # Only check forbidden codepoints for Hafs QPC (we strip rub al-hizb
     # in the Hafs pipeline; KFGQPC non-Hafs data doesn't have it).
     riwayah = _get_riwayah_for_mushaf(mushaf)
@@ -106,9 +102,17 @@ def validate_mushaf(mushaf: Mushaf) -> list[str]:
         riwayah == "hafs"
         and (mushaf.script.startswith("qpc_") or mushaf.script.startswith("text_qpc_"))
     )
-    if is_hafs_qpc:
-        errors.extend(_check_forbidden_codepoints(mushaf))
+    sequencing, empty, pages, forbidden = _check_ayahs(mushaf, check_forbidden=is_hafs_qpc)
 
+    errors = []
+    errors.extend(_check_surah_count(mushaf))
+    errors.extend(_check_surah_ordering(mushaf))
+    errors.extend(_check_ayah_counts(mushaf))
+    errors.extend(sequencing)
+    errors.extend(empty)
+    errors.extend(pages)
+    errors.extend(_check_bismillah(mushaf))
+    errors.extend(forbidden)
     return errors
 
 
@@ -119,6 +123,9 @@ def _check_surah_count(mushaf: Mushaf) -> list[str]:
 
 
 def _check_surah_ordering(mushaf: Mushaf) -> list[str]:
+    numbers = [surah.number for surah in mushaf.surahs]
+    if numbers == list(range(1, len(numbers) + 1)):
+        return []
     errors = []
     for i, surah in enumerate(mushaf.surahs):
         if surah.number != i + 1:
@@ -130,6 +137,7 @@ def _check_ayah_counts(mushaf: Mushaf) -> list[str]:
     riwayah = _get_riwayah_for_mushaf(mushaf)
     ayah_data = _RIWAYAH_AYAH_DATA.get(riwayah)
 
+    counts = ayah_data[0] if ayah_data else ()
     errors = []
     total = 0
     for surah in mushaf.surahs:
@@ -137,9 +145,9 @@ def _check_ayah_counts(mushaf: Mushaf) -> list[str]:
         total += actual
 
         # Check per-surah count if we have reference data for this riwayah
-        if ayah_data:
-            expected = ayah_data[0].get(surah.number)
-            if expected is not None and actual != expected:
+        if 1 <= surah.number <= len(counts):
+            expected = counts[surah.number - 1]
+            if actual != expected:
                 errors.append(
                     f"Surah {surah.number} ({surah.name_transliteration}): "
                     f"expected {expected} ayahs ({riwayah}), got {actual}"
@@ -160,51 +168,66 @@ def _check_ayah_counts(mushaf: Mushaf) -> list[str]:
     return errors
 
 
-def _check_ayah_sequencing(mushaf: Mushaf) -> list[str]:
-    """Verify ayah numbers are sequential 1..N within each surah."""
-    errors = []
-    for surah in mushaf.surahs:
-        for i, ayah in enumerate(surah.ayahs):
-            expected = i + 1
-            if ayah.ayah_number != expected:
-                errors.append(
-                    f"Surah {surah.number} ayah at index {i}: "
-                    f"expected number {expected}, got {ayah.ayah_number}"
-                )
-                break  # One error per surah is enough
-    return errors
+def _check_ayahs(
+    mushaf: Mushaf, check_forbidden: bool,
+) -> tuple[list[str], list[str], list[str], list[str]]:
+    """Run all per-ayah checks in a single pass over the Mushaf.
 
+    Returns separate error lists for sequencing, empty text, page numbers
+    and forbidden codepoints, so the caller can keep their report order.
+
+    - Ayah numbers must run 1..N within each surah (one error per surah).
+    - Ayah text must not be blank.
+    - Page numbers must be in range and monotonically non-decreasing.
+    - Forbidden codepoints (``check_forbidden``) must have been stripped
+      by the pipeline; QCF glyph codes use PUA/presentation codepoints,
+      so QCF scripts are skipped.
+    """
+    check_forbidden = check_forbidden and not mushaf.script.startswith("qcf_")
+    sequencing: list[str] = []
+    empty: list[str] = []
+    pages: list[str] = []
+    forbidden: list[str] = []
+    prev_page = 0
 
-def _check_empty_text(mushaf: Mushaf) -> list[str]:
-    errors = []
     for surah in mushaf.surahs:
+        numbers = [ayah.ayah_number for ayah in surah.ayahs]
+        if numbers != list(range(1, len(numbers) + 1)):
+            i = next(i for i, n in enumerate(numbers) if n != i + 1)
+            sequencing.append(
+                f"Surah {surah.number} ayah at index {i}: "
+                f"expected number {i + 1}, got {numbers[i]}"
+            )
+
         for ayah in surah.ayahs:
-            stripped = ayah.text.strip()
-            if not stripped:
-                errors.append(f"Surah {surah.number}:{ayah.ayah_number} has empty text")
-    return errors
+            if not ayah.text.strip():
+                empty.append(f"Surah {surah.number}:{ayah.ayah_number} has empty text")
+
+            page = ayah.page_number
+            if page is not None:
+                if not (_MIN_PAGE <= page <= _MAX_PAGE):
+                    pages.append(
+                        f"{surah.number}:{ayah.ayah_number} has page_number "
+                        f"{page} (expected {_MIN_PAGE}-{_MAX_PAGE})"
+                    )
+                if page < prev_page:
+                    pages.append(
+                        f"Page number decreased: {prev_page} -> {page} "
+                        f"at {surah.number}:{ayah.ayah_number}"
+                    )
+                prev_page = page
 
+            if check_forbidden:
+                found = _FORBIDDEN_RE.findall(ayah.text)
+                if found:
+                    for cp, desc in _FORBIDDEN_IN_QPC.items():
+                        if chr(cp) in found:
+                            forbidden.append(
+                                f"{surah.number}:{ayah.ayah_number} contains "
+                                f"U+{cp:04X} {desc}"
+                            )
 
-def _check_page_numbers(mushaf: Mushaf) -> list[str]:
-    """Validate page numbers are in range and monotonically non-decreasing."""
-    errors = []
-    prev_page = 0
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            if ayah.page_number is None:
-                continue
-            if not (_MIN_PAGE <= ayah.page_number <= _MAX_PAGE):
-                errors.append(
-                    f"{surah.number}:{ayah.ayah_number} has page_number "
-                    f"{ayah.page_number} (expected {_MIN_PAGE}-{_MAX_PAGE})"
-                )
-            if ayah.page_number < prev_page:
-                errors.append(
-                    f"Page number decreased: {prev_page} -> {ayah.page_number} "
-                    f"at {surah.number}:{ayah.ayah_number}"
-                )
-            prev_page = ayah.page_number
-    return errors
+    return sequencing, empty, pages, forbidden
 
 
 def _check_bismillah(mushaf: Mushaf) -> list[str]:
@@ -229,22 +252,6 @@ def _check_bismillah(mushaf: Mushaf) -> list[str]:
     return errors
 
 
-def _check_forbidden_codepoints(mushaf: Mushaf) -> list[str]:
-    """Check for codepoints that should have been stripped by the pipeline."""
-    if mushaf.script.startswith("qcf_"):
-        return []  # QCF glyph codes use PUA/presentation codepoints — skip check
-    errors = []
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            for cp, desc in _FORBIDDEN_IN_QPC.items():
-                if chr(cp) in ayah.text:
-                    errors.append(
-                        f"{surah.number}:{ayah.ayah_number} contains "
-                        f"U+{cp:04X} {desc}"
-                    )
-    return errors
-
-
 def validate_and_report(mushaf: Mushaf) -> None:
     """Run validation and print results. Raises on critical errors."""
     riwayah = _get_riwayah_for_mushaf(mushaf)
@@ -17,8 +17,11 @@ An EPUB is a ZIP file containing:
       *.ttf         — embedded Arabic fonts
 """
 
+import functools
 import logging
 import re
+import shutil
+import time
 import uuid
 import zipfile
 from datetime import datetime, timezone
@@ -46,13 +49,15 @@ from ..config.registry import (
     script_uses_glyph_fonts,
 )
 from ..config.schema import BuildConfig
-from ..models import Mushaf, Surah
+from ..models import Footnote, Mushaf, Surah
 from ..data.quran_api import get_language_direction, load_quran as load_quran_api, load_quran_qcf
 from ..data.qul_api import fetch_qul_tafsir, fetch_qul_translation
 from ..data.kfgqpc import load_quran_kfgqpc
 from ..data.tanzil import load_quran as load_quran_tanzil
+from ..data.cache import get_cache_dir
+from ..data.http_client import get_client
 from ..data.validate import validate_and_report
-from ..fonts.manager import get_font_path, get_qcf_font_paths, QCF_TOTAL_PAGES
+from ..fonts.manager import get_font_path, get_qcf_font_paths, prefetch_fonts, QCF_TOTAL_PAGES
 
 
 # Symbol font used for hizb markers (۞) and plain Arabic-Indic digits.
@@ -106,6 +111,14 @@ _COVER_FONT_DEFAULT = ("NotoSans-Regular.ttf", "Noto Sans")
 _COVER_TR_BASE_SIZE = 72
 _COVER_TR_BUMPED_SIZE = 84
 
+# Package-relative locations, resolved once at import.
+_PACKAGE_DIR = Path(__file__).parent.parent
+_TEMPLATES_DIR = _PACKAGE_DIR / "templates"
+_CSS_TEMPLATE_PATH = _TEMPLATES_DIR / "styles" / "base.css.j2"
+_ASSET_FONTS_DIR = _PACKAGE_DIR / "assets" / "fonts"
+# Cover fonts live in the repo-level fonts/cover/ (src/quran_ebook → repo root)
+_COVER_FONTS_DIR = _PACKAGE_DIR.parent.parent / "fonts" / "cover"
+
 # Project namespace UUID for deterministic EPUB identifiers.
 # Same config rebuilt produces the same UUID, so e-readers recognise updates.
 _NAMESPACE = uuid.UUID("d4f76c9a-3b1e-4f2d-9a5c-8b7e6d1c2f3a")
@@ -114,37 +127,45 @@ _NAMESPACE = uuid.UUID("d4f76c9a-3b1e-4f2d-9a5c-8b7e6d1c2f3a")
 # Scheherazade New: core Arabic letters, tashkeel, digits, hizb marker.
 # Used for in-book cover (riwayah, layout descriptor), TOC (surah names,
 # juz labels), hizb markers, and plain-numeral display.
-_SYMBOL_FONT_CODEPOINTS = {
+_SYMBOL_FONT_CODEPOINTS = frozenset({
     0x0020,                   # space
     *range(0x0621, 0x064B),   # all Arabic letters (hamza through yaa)
     *range(0x064B, 0x0656),   # tashkeel (fathatan through maddah, hamza above/below)
     0x0670,                   # superscript alef
     *range(0x0660, 0x066A),   # Arabic-Indic digits ٠١٢٣٤٥٦٧٨٩
     0x06DE,                   # rub al-hizb ۞
-}
+})
 
 # Me Quran: Arabic letters for header labels ترتيبها آياتها (no digits).
-_HEADER_LABEL_CODEPOINTS = {
+_HEADER_LABEL_CODEPOINTS = frozenset({
     0x0020,                   # space
     0x0622, 0x0627, 0x0628, 0x062A, 0x0631, 0x0647, 0x064A,
-}
+})
 
 # quran-common: bismillah ligature (U+FDFD) + cover title ligature.
 # The "quran" ASCII trigger fires a liga rule → U+E076 (ornamental القرآن الكريم).
 # Both the ASCII codepoints and the PUA target must be in the subset to
 # prevent the subsetter from pruning the GSUB rule.
-_BASMALA_FONT_CODEPOINTS = {
+_BASMALA_FONT_CODEPOINTS = frozenset({
     0xFDFD,                       # ﷽  bismillah ligature
     0xE076,                       # PUA: ornamental quran title glyph
     *[ord(c) for c in "quran"],   # ASCII trigger for liga → U+E076
-}
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_font_bytes(path: Path) -> bytes:
+    """Read a font file, memoized so batch builds read each font once per process."""
+    return path.read_bytes()
 
 
-def _subset_font(font_bytes: bytes, codepoints: set[int]) -> bytes:
+@functools.lru_cache(maxsize=8)
+def _subset_font(font_bytes: bytes, codepoints: frozenset[int]) -> bytes:
     """Subset a TTF font to only include the specified Unicode codepoints.
 
     Preserves OpenType layout features (GSUB/GPOS) needed for proper
-    Arabic shaping of the retained glyphs.
+    Arabic shaping of the retained glyphs. Memoized: batch builds subset
+    the same auxiliary fonts for every config.
     """
     font = TTFont(BytesIO(font_bytes))
     options = Options()
@@ -166,41 +187,63 @@ def _get_version() -> str:
         return "dev"
 
 
+_EASTERN_DIGITS = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+# Precomputed for every number a Mushaf uses (ayahs ≤ 286, pages ≤ 604).
+_EASTERN_NUMERALS = tuple(str(n).translate(_EASTERN_DIGITS) for n in range(700))
+
+
 def _arabic_numerals(n: int) -> str:
     """Convert an integer to Eastern Arabic-Indic numerals (٠١٢٣٤٥٦٧٨٩)."""
-    eastern = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
-    return str(n).translate(eastern)
+    if 0 <= n < len(_EASTERN_NUMERALS):
+        return _EASTERN_NUMERALS[n]
+    return str(n).translate(_EASTERN_DIGITS)
+
 
+def _annotate_navigation(
+    mushaf: Mushaf,
+) -> tuple[list[tuple[int, int, int]], list[tuple[int, int]]]:
+    """Set page markers and collect juz/page boundaries in one pass.
 
-def _compute_page_markers(mushaf: Mushaf) -> None:
-    """Set page_marker on each ayah that starts a new Madinah Mushaf page.
+    Sets page_marker on each ayah that starts a new Madinah Mushaf page
+    (mutates ayah objects in-place), and returns the navigation points
+    the TOC needs once chapter hrefs are known:
+    - juz_starts: (juz, surah_number, ayah_number) per juz boundary
+    - page_starts: (page, surah_number) per page marker
 
-    Mutates ayah objects in-place. Only has effect when page_number data
-    is available (Quran.com API source).
+    Only has effect when page_number/juz_number data is available.
     """
+    juz_starts = []
+    page_starts = []
     prev_page = None
+    prev_juz = None
     for surah in mushaf.surahs:
+        surah_number = surah.number
         for ayah in surah.ayahs:
-            if ayah.page_number is not None and ayah.page_number != prev_page:
-                ayah.page_marker = ayah.page_number
-                prev_page = ayah.page_number
-
-
-def _collect_footnotes(mushaf: Mushaf) -> list:
+            page = ayah.page_number
+            if page is not None and page != prev_page:
+                ayah.page_marker = page
+                page_starts.append((page, surah_number))
+                prev_page = page
+            juz = ayah.juz_number
+            if juz is not None and juz != prev_juz:
+                juz_starts.append((juz, surah_number, ayah.ayah_number))
+                prev_juz = juz
+    return juz_starts, page_starts
+
+
+def _collect_footnotes(mushaf: Mushaf) -> list[Footnote]:
     """Collect unique footnotes from all ayahs across all surahs.
 
     Returns deduplicated footnotes in order of first appearance.
     Used by bilingual and WBW builders to populate endnotes.xhtml.
     """
-    all_footnotes = []
-    seen_ids: set[int] = set()
+    # Dicts keep insertion order, so setdefault keeps each id's first footnote
+    footnotes_by_id: dict[int, Footnote] = {}
     for surah in mushaf.surahs:
         for ayah in surah.ayahs:
             for fn in ayah.footnotes:
-                if fn.id not in seen_ids:
-                    all_footnotes.append(fn)
-                    seen_ids.add(fn.id)
-    return all_footnotes
+                footnotes_by_id.setdefault(fn.id, fn)
+    return list(footnotes_by_id.values())
 
 
 def _sanitize_tafsir_text(text: str) -> str:
@@ -223,85 +266,77 @@ def _load_tafsir_into_mushaf(mushaf: Mushaf, tafsir_config) -> None:
     Used by bilingual+interactive layout where translation is inline
     and tafsir appears in popup endnotes.
     """
-    import httpx
-
     source = tafsir_config.source
     resource_id = tafsir_config.resource_id
     cached_count = 0
     fetched_count = 0
 
-    with httpx.Client(timeout=30) as client:
-        click.echo(f"Loading tafsir: {tafsir_config.name} (resource {resource_id})")
-        for surah in mushaf.surahs:
-            if source == "qul_tafsir":
-                tafsir_data, from_cache = fetch_qul_tafsir(
-                    client, surah.number, resource_id, surah.ayah_count
-                )
-            else:
-                tafsir_data, from_cache = fetch_qul_translation(
-                    client, surah.number, resource_id, surah.ayah_count
-                )
+    client = get_client()
+    click.echo(f"Loading tafsir: {tafsir_config.name} (resource {resource_id})")
+    for surah in mushaf.surahs:
+        if source == "qul_tafsir":
+            tafsir_data, from_cache = fetch_qul_tafsir(
+                client, surah.number, resource_id, surah.ayah_count
+            )
+        else:
+            tafsir_data, from_cache = fetch_qul_translation(
+                client, surah.number, resource_id, surah.ayah_count
+            )
 
-            if from_cache:
-                cached_count += 1
-            else:
-                fetched_count += 1
-                click.echo(f"  Fetched tafsir surah {surah.number}/114: {surah.name_transliteration}")
+        if from_cache:
+            cached_count += 1
+        else:
+            fetched_count += 1
+            click.echo(f"  Fetched tafsir surah {surah.number}/114: {surah.name_transliteration}")
 
-            for i, ayah in enumerate(surah.ayahs):
-                if i < len(tafsir_data):
-                    text = tafsir_data[i].get("text", "")
-                    if text:
-                        ayah.tafsir = _sanitize_tafsir_text(text)
+        for i, ayah in enumerate(surah.ayahs):
+            if i < len(tafsir_data):
+                text = tafsir_data[i].get("text", "")
+                if text:
+                    ayah.tafsir = _sanitize_tafsir_text(text)
 
     click.echo(f"  Tafsir: {cached_count} cached, {fetched_count} fetched from API")
 
 
-def _compute_page_list(mushaf: Mushaf, page_href_fn) -> list[dict]:
-    """Build page-list entries for EPUB3 navigation.
-
-    Returns a list of dicts with keys: page, href, label.
-    Only works when ayah data includes page_number (Quran.com API source).
+def _compute_nav_entries(
+    juz_starts: list[tuple[int, int, int]],
+    page_starts: list[tuple[int, int]],
+    href_fn,
+    page_href_fn,
+) -> tuple[list[dict], list[dict]]:
+    """Build juz and page-list entries for EPUB3 navigation.
 
-    Args:
-        page_href_fn: callable(surah_number, page_number) -> href string
-            pointing to the pagebreak span's ID.
-    """
-    entries = []
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            if ayah.page_marker is not None:
-                entries.append({
-                    "page": ayah.page_marker,
-                    "href": page_href_fn(surah.number, ayah.page_marker),
-                    "label": str(ayah.page_marker),
-                })
-    return entries
-
-
-def _compute_juz_entries(mushaf: Mushaf, href_fn) -> list[dict]:
-    """Extract juz boundary information for TOC navigation.
+    Takes the boundaries collected by _annotate_navigation, so only the
+    ~650 juz/page starts are visited rather than every ayah.
 
-    Returns a list of dicts with keys: juz, href, label_text, label_num.
-    Only works when ayah data includes juz_number (Quran.com API source).
-    Always uses Arabic labels and numerals (Arabic-first design).
+    Returns (juz_entries, page_list):
+    - juz_entries: dicts with keys juz, href, label_text, label_num — one per
+      juz boundary. Always uses Arabic labels and numerals (Arabic-first design).
+    - page_list: dicts with keys page, href, label — one per pagebreak.
 
     Args:
         href_fn: callable(surah_number, ayah_number) -> href string
+        page_href_fn: callable(surah_number, page_number) -> href string
+            pointing to the pagebreak span's ID.
     """
-    entries = []
-    prev_juz = None
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            if ayah.juz_number is not None and ayah.juz_number != prev_juz:
-                entries.append({
-                    "juz": ayah.juz_number,
-                    "href": href_fn(surah.number, ayah.ayah_number),
-                    "label_text": "جزء",
-                    "label_num": _arabic_numerals(ayah.juz_number),
-                })
-                prev_juz = ayah.juz_number
-    return entries
+    juz_entries = [
+        {
+            "juz": juz,
+            "href": href_fn(surah_number, ayah_number),
+            "label_text": "جزء",
+            "label_num": _arabic_numerals(juz),
+        }
+        for juz, surah_number, ayah_number in juz_starts
+    ]
+    page_list = [
+        {
+            "page": page,
+            "href": page_href_fn(surah_number, page),
+            "label": str(page),
+        }
+        for page, surah_number in page_starts
+    ]
+    return juz_entries, page_list
 
 
 def _render_cover_image(
@@ -462,17 +497,21 @@ def _build_cover_subtitle(config: BuildConfig) -> str | None:
     return script_info[1] if script_info else None
 
 
-def _build_descriptive_title(config: BuildConfig) -> str:
+def _build_descriptive_title(config: BuildConfig, subtitle: str | None) -> str:
     """Build a descriptive title for OPF metadata.
 
+    ``subtitle`` is the cover subtitle from ``_build_cover_subtitle``,
+    which the caller has already computed.
+
     Arabic-only:    "القرآن الكريم برواية حفص عن عاصم"
     Bilingual:      "القرآن الكريم برواية حفص عن عاصم · آية بآية · English"
     WBW:            "القرآن الكريم برواية حفص عن عاصم · كلمة بكلمة · Türkçe"
     WBW cross-lang: "القرآن الكريم برواية حفص عن عاصم · كلمة بكلمة · Français · English WBW"
     """
-    full_riwayah = _build_cover_subtitle(config) or RIWAYAH_ARABIC.get(
-        get_riwayah(config.quran.script), get_riwayah(config.quran.script)
-    )
+    full_riwayah = subtitle
+    if not full_riwayah:
+        riwayah = get_riwayah(config.quran.script)
+        full_riwayah = RIWAYAH_ARABIC.get(riwayah, riwayah)
     # Title + riwayah read as one phrase (no separator)
     base = f"{config.book.title} {full_riwayah}"
     if not config.translation:
@@ -499,14 +538,29 @@ def _build_descriptive_title(config: BuildConfig) -> str:
     return " · ".join(parts)
 
 
-def _create_jinja_env() -> jinja2.Environment:
-    """Create a Jinja2 environment with the templates directory."""
-    templates_dir = Path(__file__).parent.parent / "templates"
+@functools.lru_cache(maxsize=None)
+def _create_jinja_env(use_glyph_fonts: bool, render_ayah_numbers: bool) -> jinja2.Environment:
+    """Create a Jinja2 environment with the templates directory.
+
+    Cached per combination of render globals, so every build in a process
+    with the same settings reuses the already loaded and compiled templates.
+    Templates are package data that don't change at runtime, so
+    ``auto_reload`` is off and cached templates are never re-stat'ed.
+    """
+    # Compiled templates persist in .cache/jinja/, so a fresh CLI process
+    # skips lexing/parsing/compiling.  Entries are keyed on a checksum of the
+    # template source, so edited templates are recompiled automatically.
+    bytecode_dir = get_cache_dir() / "jinja"
+    bytecode_dir.mkdir(exist_ok=True)
     env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(templates_dir)),
+        loader=jinja2.FileSystemLoader(str(_TEMPLATES_DIR)),
         autoescape=False,  # XHTML templates handle their own escaping
+        auto_reload=False,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(str(bytecode_dir)),
     )
     env.filters["arabic_numerals"] = _arabic_numerals
+    env.globals["use_glyph_fonts"] = use_glyph_fonts
+    env.globals["render_ayah_numbers"] = render_ayah_numbers
     return env
 
 
@@ -538,12 +592,11 @@ def render_cover_png(
 
     cover_fonts: dict[str, bytes] = {_font_info.filename: font_bytes}
     cover_fonts[FONTS[BASMALA_FONT_KEY].filename] = basmala_font_bytes
-    cover_font_dir = Path(__file__).parent.parent.parent.parent / "fonts" / "cover"
 
     # Load full Scheherazade for riwayah line from fonts/cover/ (not the subsetted
     # symbol version bundled in EPUB).  Committed to repo for CI determinism.
     riwayah_font_info = FONTS[COVER_RIWAYAH_FONT_KEY]
-    riwayah_font_path = cover_font_dir / riwayah_font_info.filename
+    riwayah_font_path = _COVER_FONTS_DIR / riwayah_font_info.filename
     riwayah_font_bytes = riwayah_font_path.read_bytes()
     cover_fonts[riwayah_font_info.filename] = riwayah_font_bytes
     cover_font_faces: dict[str, str] = {
@@ -556,7 +609,7 @@ def render_cover_png(
     tr_font_size = _COVER_TR_BASE_SIZE
     if tr_lang in _COVER_FONTS:
         tr_filename, tr_font_family = _COVER_FONTS[tr_lang]
-        tr_font_path = cover_font_dir / tr_filename
+        tr_font_path = _COVER_FONTS_DIR / tr_filename
         if tr_font_path.exists():
             cover_fonts[tr_filename] = tr_font_path.read_bytes()
             cover_font_faces[tr_font_family] = tr_filename
@@ -573,7 +626,7 @@ def render_cover_png(
     else:
         # Latin/Cyrillic — load Noto Sans as default
         default_filename, tr_font_family = _COVER_FONT_DEFAULT
-        default_path = cover_font_dir / default_filename
+        default_path = _COVER_FONTS_DIR / default_filename
         if default_path.exists():
             cover_fonts[default_filename] = default_path.read_bytes()
             cover_font_faces[tr_font_family] = default_filename
@@ -622,6 +675,15 @@ def render_cover_png(
     )
 
 
+# Each riwayah has a specific teacher (qari) in the chain of transmission.
+_RIWAYAH_TEACHER = {
+    "hafs": "'Asim", "shubah": "'Asim",
+    "warsh": "Nafi'", "qalun": "Nafi'",
+    "doori": "Abu 'Amr", "soosi": "Abu 'Amr",
+    "bazzi": "Ibn Kathir", "qunbul": "Ibn Kathir",
+}
+
+
 def _render_package_opf(
     config: BuildConfig,
     chapter_items: list[tuple[str, str]],
@@ -690,7 +752,7 @@ def _render_package_opf(
     # Add translation language if bilingual
     extra_lang = ""
     if config.translation:
-        extra_lang = f"\n    <dc:language>{config.translation.language}</dc:language>"
+        extra_lang = f"\n    <dc:language>{xml_escape(config.translation.language)}</dc:language>"
 
     # Translator as dc:creator (only for translated variants)
     creator_line = ""
@@ -704,13 +766,6 @@ def _render_package_opf(
     riwayah = get_riwayah(config.quran.script)
     layout_info = LAYOUT_LABELS.get(config.layout.structure)
     layout_en = layout_info[0] if layout_info else config.layout.structure
-    # Each riwayah has a specific teacher (qari) in the chain of transmission.
-    _RIWAYAH_TEACHER = {
-        "hafs": "'Asim", "shubah": "'Asim",
-        "warsh": "Nafi'", "qalun": "Nafi'",
-        "doori": "Abu 'Amr", "soosi": "Abu 'Amr",
-        "bazzi": "Ibn Kathir", "qunbul": "Ibn Kathir",
-    }
     teacher = _RIWAYAH_TEACHER.get(riwayah, "'Asim")
     desc_parts = [f"Riwayat {riwayah.title()} 'an {teacher}"]
     desc_parts.append(layout_en)
@@ -729,13 +784,18 @@ def _render_package_opf(
         )
     description = ", ".join(desc_parts)
 
+    # Lands in an attribute as well as element text; html.escape covers quotes
+    book_language = xml_escape(config.book.language)
+    manifest_xml = "\n    ".join(manifest_items)
+    spine_xml = "\n    ".join(spine_items)
+
     return f"""<?xml version="1.0" encoding="utf-8"?>
 <package xmlns="http://www.idpf.org/2007/opf" version="3.0"
-         unique-identifier="bookid" xml:lang="{config.book.language}" dir="rtl">
+         unique-identifier="bookid" xml:lang="{book_language}" dir="rtl">
   <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
     <dc:identifier id="bookid">urn:uuid:{book_id}</dc:identifier>
     <dc:title>{xml_escape(descriptive_title)}</dc:title>
-    <dc:language>{config.book.language}</dc:language>{extra_lang}
+    <dc:language>{book_language}</dc:language>{extra_lang}
     <dc:description>{xml_escape(description)}</dc:description>{creator_line}
     <dc:publisher>quran-ebook</dc:publisher>
     <dc:subject>Quran</dc:subject>
@@ -746,15 +806,17 @@ def _render_package_opf(
     <meta name="cover" content="cover-image"/>
   </metadata>
   <manifest>
-    {"".join(f"    {item}" + chr(10) for item in manifest_items)}  </manifest>
+    {manifest_xml}
+  </manifest>
   <spine page-progression-direction="rtl">
-    {"".join(f"    {item}" + chr(10) for item in spine_items)}  </spine>
+    {spine_xml}
+  </spine>
 </package>
 """
 
 
-def _render_container_xml() -> str:
-    return """<?xml version="1.0" encoding="utf-8"?>
+# Fixed META-INF documents, written verbatim into every EPUB
+_CONTAINER_XML = b"""<?xml version="1.0" encoding="utf-8"?>
 <container xmlns="urn:oasis:names:tc:opendocument:xmlns:container" version="1.0">
   <rootfiles>
     <rootfile full-path="OEBPS/package.opf" media-type="application/oebps-package+xml"/>
@@ -762,9 +824,7 @@ def _render_container_xml() -> str:
 </container>
 """
 
-
-def _render_ibooks_options() -> str:
-    return """<?xml version="1.0" encoding="utf-8"?>
+_IBOOKS_OPTIONS_XML = b"""<?xml version="1.0" encoding="utf-8"?>
 <display_options>
   <platform name="*">
     <option name="specified-fonts">true</option>
@@ -773,28 +833,75 @@ def _render_ibooks_options() -> str:
 """
 
 
-def _assemble_epub(files: dict[str, bytes]) -> bytes:
-    """Assemble an EPUB zip archive.
+# "{{ name }}" placeholders in base.css.j2, filled by build_epub
+_CSS_PLACEHOLDER = re.compile(rb"\{\{ (\w+) \}\}")
+
+
+# Already-compressed formats gain nothing from DEFLATE, so they are stored.
+# TTF/OTF are not listed: their tables typically deflate to about half size.
+_STORED_SUFFIXES = (".png", ".woff", ".woff2")
+# Fastest DEFLATE level: across full books, level 1 compresses text and fonts
+# 2-4x faster than level 9 for archives under 10% larger.
+_COMPRESSLEVEL = 1
+
+
+class _EpubWriter:
+    """Write EPUB entries into the zip archive as soon as they are produced.
+
+    Used as ``files[path] = content``, so builders emit each chapter right
+    after rendering it instead of collecting every file in memory first.
+    ``content`` may also be a Path, which is copied into the archive in
+    chunks without reading the whole file into memory.
+    The archive is streamed to a temporary file next to ``output_path`` and
+    renamed into place on success, so a failed build never leaves a
+    truncated EPUB behind.
 
     The EPUB spec requires:
     - mimetype must be the first entry
     - mimetype must be stored uncompressed (ZIP_STORED)
     - mimetype must have no extra field (byte offset 0 for the content after the local header)
     """
-    buf = BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self._tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        self._zf: zipfile.ZipFile | None = None
+
+    def __enter__(self) -> "_EpubWriter":
+        self._zf = zipfile.ZipFile(
+            self._tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=_COMPRESSLEVEL
+        )
         # mimetype MUST be first, uncompressed, no extra field
         info = zipfile.ZipInfo("mimetype")
         info.compress_type = zipfile.ZIP_STORED
         info.extra = b""
-        zf.writestr(info, "application/epub+zip")
-
-        # Everything else, deflated
-        for path, content in files.items():
-            zf.writestr(path, content)
-
-    return buf.getvalue()
+        self._zf.writestr(info, "application/epub+zip")
+        return self
+
+    def __setitem__(self, path: str, content: bytes | Path) -> None:
+        # Everything else deflated, except formats that are already compressed
+        compress_type = zipfile.ZIP_STORED if path.endswith(_STORED_SUFFIXES) else None
+        if isinstance(content, Path):
+            # Same entry metadata as writestr() gives a name: ZipFile.write()
+            # would copy the source file's mtime and mode, and rejects
+            # pre-1980 mtimes (e.g. normalized ones in reproducible installs).
+            info = zipfile.ZipInfo(path, date_time=time.localtime()[:6])
+            info.compress_type = (
+                self._zf.compression if compress_type is None else compress_type
+            )
+            info._compresslevel = self._zf.compresslevel
+            info.external_attr = 0o600 << 16
+            with content.open("rb") as src, self._zf.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            self._zf.writestr(path, content, compress_type=compress_type)
 
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._zf.close()
+        if exc_type is None:
+            self._tmp_path.replace(self.output_path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
 
 
 def build_epub(config: BuildConfig) -> Path:
@@ -855,26 +962,37 @@ def build_epub(config: BuildConfig) -> Path:
     if config.tafsir:
         _load_tafsir_into_mushaf(mushaf, config.tafsir)
 
-    # 3. Compute page markers (before rendering templates)
-    _compute_page_markers(mushaf)
+    # 3. Compute page markers and navigation points (before rendering templates).
+    # Tanzil text carries no page or juz numbers, so the per-ayah pass has
+    # nothing to find there.
+    if source != "tanzil":
+        juz_starts, page_starts = _annotate_navigation(mushaf)
+    else:
+        juz_starts, page_starts = [], []
 
     # 4. Resolve fonts (primary + symbol + basmala)
     is_qcf = config.font.arabic.startswith("qcf_")
+    # Any fonts missing from the assets and cache download concurrently
+    prefetch_fonts([
+        SYMBOL_FONT_KEY if is_qcf else config.font.arabic,
+        SYMBOL_FONT_KEY,
+        HEADER_LABEL_FONT_KEY,
+    ])
     qcf_font_paths: dict[int, Path] = {}
     if is_qcf:
         qcf_font_paths = get_qcf_font_paths(config.font.arabic)
         # Use Scheherazade as a stand-in "primary font" for non-glyph text (headers, etc.)
         font_info = FONTS[SYMBOL_FONT_KEY]
         font_path = get_font_path(SYMBOL_FONT_KEY)
-        font_bytes = font_path.read_bytes()
+        font_bytes = _load_font_bytes(font_path)
     else:
         font_info = FONTS[config.font.arabic]
         font_path = get_font_path(config.font.arabic)
-        font_bytes = font_path.read_bytes()
+        font_bytes = _load_font_bytes(font_path)
 
     symbol_font_info = FONTS[SYMBOL_FONT_KEY]
     symbol_font_path = get_font_path(SYMBOL_FONT_KEY)
-    symbol_font_bytes = symbol_font_path.read_bytes()
+    symbol_font_bytes = _load_font_bytes(symbol_font_path)
     symbol_full_size = len(symbol_font_bytes)
     symbol_font_bytes = _subset_font(symbol_font_bytes, _SYMBOL_FONT_CODEPOINTS)
     click.echo(
@@ -884,9 +1002,9 @@ def build_epub(config: BuildConfig) -> Path:
 
     basmala_font_info = FONTS[BASMALA_FONT_KEY]
     basmala_font_path = (
-        Path(__file__).parent.parent / "assets" / "fonts" / basmala_font_info.filename
+        _ASSET_FONTS_DIR / basmala_font_info.filename
     )
-    basmala_font_bytes = basmala_font_path.read_bytes()
+    basmala_font_bytes = _load_font_bytes(basmala_font_path)
     basmala_full_size = len(basmala_font_bytes)
     basmala_font_bytes = _subset_font(basmala_font_bytes, _BASMALA_FONT_CODEPOINTS)
     click.echo(
@@ -896,7 +1014,7 @@ def build_epub(config: BuildConfig) -> Path:
 
     header_label_font_info = FONTS[HEADER_LABEL_FONT_KEY]
     header_label_font_path = get_font_path(HEADER_LABEL_FONT_KEY)
-    header_label_font_bytes = header_label_font_path.read_bytes()
+    header_label_font_bytes = _load_font_bytes(header_label_font_path)
     header_label_full_size = len(header_label_font_bytes)
     header_label_font_bytes = _subset_font(
         header_label_font_bytes, _HEADER_LABEL_CODEPOINTS
@@ -908,250 +1026,250 @@ def build_epub(config: BuildConfig) -> Path:
 
     surah_name_font_info = FONTS[SURAH_NAME_FONT_KEY]
     surah_name_font_path = (
-        Path(__file__).parent.parent / "assets" / "fonts" / surah_name_font_info.filename
+        _ASSET_FONTS_DIR / surah_name_font_info.filename
     )
-    surah_name_font_bytes = surah_name_font_path.read_bytes()
 
     # 5. Render CSS with font info
-    css_template_path = Path(__file__).parent.parent / "templates" / "styles" / "base.css.j2"
-    css_text = css_template_path.read_text(encoding="utf-8")
-    css_text = css_text.replace("{{ font_family }}", font_info.family)
-    css_text = css_text.replace("{{ font_filename }}", font_info.filename)
-    css_text = css_text.replace("{{ symbol_font_family }}", symbol_font_info.family)
-    css_text = css_text.replace("{{ symbol_font_filename }}", symbol_font_info.filename)
     # For scripts without Naskh glyph font compatibility (KFGQPC non-Hafs,
     # IndoPak Nastaleeq), render basmala with primary font (no U+FDFD ligature).
-    _use_glyphs = script_uses_glyph_fonts(config.quran.script) and config.quran.source != "kfgqpc"
+    _use_glyphs = script_uses_glyph_fonts(script) and source != "kfgqpc"
     basmala_css_family = basmala_font_info.family if _use_glyphs else font_info.family
-    css_text = css_text.replace("{{ basmala_font_family }}", basmala_css_family)
-    css_text = css_text.replace("{{ basmala_font_filename }}", basmala_font_info.filename)
-    css_text = css_text.replace("{{ header_label_font_family }}", header_label_font_info.family)
-    css_text = css_text.replace("{{ header_label_font_filename }}", header_label_font_info.filename)
-    css_text = css_text.replace("{{ surah_name_font_family }}", surah_name_font_info.family)
-    css_text = css_text.replace("{{ surah_name_font_filename }}", surah_name_font_info.filename)
     # Hizb marker: scripts with glyph fonts use Scheherazade at 0.8em,
     # others use primary font at 0.6em.
     hizb_font_family = symbol_font_info.family if _use_glyphs else font_info.family
     hizb_font_size = "0.8em" if _use_glyphs else "0.6em"
-    css_text = css_text.replace("{{ hizb_font_family }}", hizb_font_family)
-    css_text = css_text.replace("{{ hizb_font_size }}", hizb_font_size)
     translation_font_size = (
         get_translation_font_size(config.translation.language)
         if config.translation
         else "0.6em"
     )
-    css_text = css_text.replace("{{ translation_font_size }}", translation_font_size)
     # WBW gloss = 90% of translation size — scales with script-specific bumps
     trans_em = float(translation_font_size.replace("em", ""))
     wbw_gloss_font_size = f"{trans_em * 0.9:.3g}em"
-    css_text = css_text.replace("{{ wbw_gloss_font_size }}", wbw_gloss_font_size)
+    css_vars = {
+        "font_family": font_info.family,
+        "font_filename": font_info.filename,
+        "symbol_font_family": symbol_font_info.family,
+        "symbol_font_filename": symbol_font_info.filename,
+        "basmala_font_family": basmala_css_family,
+        "basmala_font_filename": basmala_font_info.filename,
+        "header_label_font_family": header_label_font_info.family,
+        "header_label_font_filename": header_label_font_info.filename,
+        "surah_name_font_family": surah_name_font_info.family,
+        "surah_name_font_filename": surah_name_font_info.filename,
+        "hizb_font_family": hizb_font_family,
+        "hizb_font_size": hizb_font_size,
+        "translation_font_size": translation_font_size,
+        "wbw_gloss_font_size": wbw_gloss_font_size,
+    }
+    # Single pass over the raw template bytes, with no decode/encode round
+    # trip; unknown placeholders are left as-is
+    css_values = {name.encode(): value.encode("utf-8") for name, value in css_vars.items()}
+    css_bytes = _CSS_PLACEHOLDER.sub(
+        lambda m: css_values.get(m.group(1), m.group(0)),
+        _CSS_TEMPLATE_PATH.read_bytes(),
+    )
 
     # 5b. QCF per-page font CSS (604 @font-face rules + per-page classes)
     if is_qcf:
         qcf_css = _generate_qcf_css(config.font.arabic)
-        css_text += "\n" + qcf_css
+        css_bytes += b"\n" + qcf_css.encode("utf-8")
 
     # 6. Render XHTML files
-    env = _create_jinja_env()
-    # Scripts without Naskh glyph font compatibility (KFGQPC non-Hafs,
-    # IndoPak Nastaleeq) fall back to plain Arabic text in the primary font.
-    env.globals["use_glyph_fonts"] = _use_glyphs
-    # IndoPak text has built-in ayah markers (PUA glyphs from the font).
-    # Don't render our own ayah number digits on top of them.
-    env.globals["render_ayah_numbers"] = not config.quran.script.startswith("text_indopak")
+    env = _create_jinja_env(
+        # Scripts without Naskh glyph font compatibility (KFGQPC non-Hafs,
+        # IndoPak Nastaleeq) fall back to plain Arabic text in the primary font.
+        use_glyph_fonts=_use_glyphs,
+        # IndoPak text has built-in ayah markers (PUA glyphs from the font).
+        # Don't render our own ayah number digits on top of them.
+        render_ayah_numbers=not config.quran.script.startswith("text_indopak"),
+    )
     layout = config.layout.structure
 
     cover_template = env.get_template("cover.xhtml.j2")
     toc_template = env.get_template("toc.xhtml.j2")
 
-    files: dict[str, bytes] = {}
-
-    # META-INF
-    files["META-INF/container.xml"] = _render_container_xml().encode("utf-8")
-    files["META-INF/com.apple.ibooks.display-options.xml"] = (
-        _render_ibooks_options().encode("utf-8")
-    )
-
-    # Cover
-    is_bilingual = config.translation is not None
-    subtitle = _build_cover_subtitle(config)
-    translation_label = None
-    if is_bilingual:
-        lang_name = (
-            config.translation.language_name
-            or NATIVE_LANGUAGE_NAMES.get(config.translation.language)
-            or config.translation.language.upper()
-        )
-        label_parts = [lang_name, config.translation.display_name]
-        if config.tafsir:
-            label_parts.append(config.tafsir.display_name)
-        translation_label = xml_escape(" · ".join(label_parts))
-    # Layout descriptor for cover — only when translation exists
-    # (distinguishes bilingual آية بآية from interactive نص مستمر)
-    layout_descriptor = None
-    if config.translation:
-        layout_info = LAYOUT_LABELS.get(layout)
-        if layout_info:
-            layout_descriptor = layout_info[1]
-
-    cover_html = cover_template.render(
-        title=config.book.title,
-        subtitle=subtitle,
-        font_family=font_info.family,
-        font_filename=font_info.filename,
-        cover_font_family=basmala_font_info.family,
-        cover_font_filename=basmala_font_info.filename,
-        symbol_font_family=symbol_font_info.family,
-        symbol_font_filename=symbol_font_info.filename,
-        translation_label=translation_label,
-        layout_descriptor=layout_descriptor,
-        version=_get_version(),
-    )
-    files["OEBPS/cover.xhtml"] = cover_html.encode("utf-8")
-
-    # Cover image for library/cover browsers
-    click.echo("Rendering cover image...")
-    cover_png = render_cover_png(config, font_bytes, basmala_font_bytes, cover_html)
-    files["OEBPS/cover.png"] = cover_png
-    click.echo(f"  Cover image: {len(cover_png):,} bytes")
-
-    # Chapters + TOC (layout-dependent)
-    # Glyph-font-compatible scripts: use U+FDFD ornamental basmala from quran-common.
-    # Others (KFGQPC non-Hafs, IndoPak Nastaleeq): use actual basmala text from
-    # Al-Fatiha 1:1 (quran_api) or S27:30 (kfgqpc), rendered in primary font.
-    if _use_glyphs:
-        bismillah = "\uFDFD"
-    else:
-        bismillah = mushaf.bismillah_text
-    if layout == "qcf_interactive":
-        if not config.translation:
-            raise ValueError("qcf_interactive layout requires a translation config")
-        translation_dir = get_language_direction(config.translation.language)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_interactive(
-            env, mushaf, files, bismillah, config.translation.language, translation_dir
-        )
-    elif layout == "qcf_by_surah":
-        if not config.translation:
-            raise ValueError("qcf_by_surah layout requires a translation config")
-        translation_dir = get_language_direction(config.translation.language)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_bilingual(
-            env, mushaf, files, bismillah, config.translation.language, translation_dir
-        )
-    elif layout == "qcf_fixed":
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_fixed(
-            env, mushaf, files, bismillah
-        )
-    elif layout == "qcf_fixed_interactive":
-        if not config.translation:
-            raise ValueError("qcf_fixed_interactive layout requires a translation config")
-        translation_dir = get_language_direction(config.translation.language)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_fixed_interactive(
-            env, mushaf, files, bismillah, config.translation.language, translation_dir
-        )
-    elif layout == "qcf_inline":
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf(
-            env, mushaf, files, bismillah
-        )
-    elif layout == "wbw":
-        if not config.translation:
-            raise ValueError("wbw layout requires a translation config")
-        wbw_gloss_lang = config.layout.wbw_gloss_language or config.translation.language
-        wbw_gloss_dir = get_language_direction(wbw_gloss_lang)
-        translation_lang = config.translation.language
-        translation_dir = get_language_direction(translation_lang)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_wbw(
-            env, mushaf, files, bismillah, config,
-            wbw_gloss_lang, wbw_gloss_dir,
-            translation_lang, translation_dir,
-        )
-    elif layout == "interactive_inline":
-        if not config.translation:
-            raise ValueError("interactive_inline layout requires a translation config")
-        translation_dir = get_language_direction(config.translation.language)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_interactive(
-            env, mushaf, files, bismillah, config.translation.language, translation_dir
-        )
-    elif layout == "bilingual_interactive":
-        if not config.translation:
-            raise ValueError("bilingual_interactive layout requires a translation config")
-        if not config.tafsir:
-            raise ValueError("bilingual_interactive layout requires a tafsir config")
-        translation_dir = get_language_direction(config.translation.language)
-        tafsir_dir = get_language_direction(config.tafsir.language)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_bilingual_interactive(
-            env, mushaf, files, bismillah,
-            config.translation.language, translation_dir,
-            config.tafsir.language, tafsir_dir,
-        )
-    elif config.translation:
-        translation_dir = get_language_direction(config.translation.language)
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_bilingual(
-            env, mushaf, files, bismillah, config.translation.language, translation_dir
-        )
-    elif layout == "inline":
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_continuous(
-            env, mushaf, files, bismillah
-        )
-    else:
-        chapter_items, href_fn, page_href_fn, chapter_href = _build_by_surah(
-            env, mushaf, files, bismillah
-        )
-
-    # TOC
-    juz_entries = _compute_juz_entries(mushaf, href_fn=href_fn)
-    page_list = _compute_page_list(mushaf, page_href_fn=page_href_fn)
-    toc_html = toc_template.render(
-        surahs=mushaf.surahs,
-        juz_entries=juz_entries,
-        page_list=page_list,
-        chapter_href=chapter_href,
-        is_bilingual=is_bilingual,
-        symbol_font_family=symbol_font_info.family,
-    )
-    files["OEBPS/toc.xhtml"] = toc_html.encode("utf-8")
-
-    # CSS
-    files["OEBPS/styles/base.css"] = css_text.encode("utf-8")
-
-    # Fonts
-    files[f"OEBPS/fonts/{font_info.filename}"] = font_bytes
-    font_filenames = [font_info.filename]
-    if symbol_font_info.filename != font_info.filename:
-        files[f"OEBPS/fonts/{symbol_font_info.filename}"] = symbol_font_bytes
-        font_filenames.append(symbol_font_info.filename)
-    if basmala_font_info.filename not in font_filenames:
-        files[f"OEBPS/fonts/{basmala_font_info.filename}"] = basmala_font_bytes
-        font_filenames.append(basmala_font_info.filename)
-    if header_label_font_info.filename not in font_filenames:
-        files[f"OEBPS/fonts/{header_label_font_info.filename}"] = header_label_font_bytes
-        font_filenames.append(header_label_font_info.filename)
-    if surah_name_font_info.filename not in font_filenames:
-        files[f"OEBPS/fonts/{surah_name_font_info.filename}"] = surah_name_font_bytes
-        font_filenames.append(surah_name_font_info.filename)
-
-    # QCF per-page fonts (604 files)
-    if is_qcf:
-        click.echo(f"  Embedding {QCF_TOTAL_PAGES} QCF page fonts...")
-        for page_num, page_font_path in sorted(qcf_font_paths.items()):
-            fname = f"p{page_num}.ttf"
-            files[f"OEBPS/fonts/{fname}"] = page_font_path.read_bytes()
-            font_filenames.append(fname)
-
-    # OPF
-    descriptive_title = _build_descriptive_title(config)
-    opf = _render_package_opf(config, chapter_items, font_filenames, descriptive_title)
-    files["OEBPS/package.opf"] = opf.encode("utf-8")
-
-    # 7. Assemble EPUB
-    epub_bytes = _assemble_epub(files)
-
-    # 8. Write to output
+    # Entries are written into the EPUB as they are produced
     output_dir = Path(config.output.directory)
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"{config.output_filename}.epub"
-    output_path.write_bytes(epub_bytes)
+    with _EpubWriter(output_path) as files:
+        # META-INF
+        files["META-INF/container.xml"] = _CONTAINER_XML
+        files["META-INF/com.apple.ibooks.display-options.xml"] = _IBOOKS_OPTIONS_XML
+
+        # Cover
+        is_bilingual = config.translation is not None
+        subtitle = _build_cover_subtitle(config)
+        translation_label = None
+        if is_bilingual:
+            lang_name = (
+                config.translation.language_name
+                or NATIVE_LANGUAGE_NAMES.get(config.translation.language)
+                or config.translation.language.upper()
+            )
+            label_parts = [lang_name, config.translation.display_name]
+            if config.tafsir:
+                label_parts.append(config.tafsir.display_name)
+            translation_label = xml_escape(" · ".join(label_parts))
+        # Layout descriptor for cover — only when translation exists
+        # (distinguishes bilingual آية بآية from interactive نص مستمر)
+        layout_descriptor = None
+        if config.translation:
+            layout_info = LAYOUT_LABELS.get(layout)
+            if layout_info:
+                layout_descriptor = layout_info[1]
+
+        cover_html = cover_template.render(
+            title=config.book.title,
+            subtitle=subtitle,
+            font_family=font_info.family,
+            font_filename=font_info.filename,
+            cover_font_family=basmala_font_info.family,
+            cover_font_filename=basmala_font_info.filename,
+            symbol_font_family=symbol_font_info.family,
+            symbol_font_filename=symbol_font_info.filename,
+            translation_label=translation_label,
+            layout_descriptor=layout_descriptor,
+            version=_get_version(),
+        )
+        files["OEBPS/cover.xhtml"] = cover_html.encode("utf-8")
+
+        # Cover image for library/cover browsers
+        click.echo("Rendering cover image...")
+        cover_png = render_cover_png(config, font_bytes, basmala_font_bytes, cover_html)
+        files["OEBPS/cover.png"] = cover_png
+        click.echo(f"  Cover image: {len(cover_png):,} bytes")
+
+        # Chapters + TOC (layout-dependent)
+        # Glyph-font-compatible scripts: use U+FDFD ornamental basmala from quran-common.
+        # Others (KFGQPC non-Hafs, IndoPak Nastaleeq): use actual basmala text from
+        # Al-Fatiha 1:1 (quran_api) or S27:30 (kfgqpc), rendered in primary font.
+        if _use_glyphs:
+            bismillah = "\uFDFD"
+        else:
+            bismillah = mushaf.bismillah_text
+        if layout == "qcf_interactive":
+            if not config.translation:
+                raise ValueError("qcf_interactive layout requires a translation config")
+            translation_dir = get_language_direction(config.translation.language)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_interactive(
+                env, mushaf, files, bismillah, config.translation.language, translation_dir
+            )
+        elif layout == "qcf_by_surah":
+            if not config.translation:
+                raise ValueError("qcf_by_surah layout requires a translation config")
+            translation_dir = get_language_direction(config.translation.language)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_bilingual(
+                env, mushaf, files, bismillah, config.translation.language, translation_dir
+            )
+        elif layout == "qcf_fixed":
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_fixed(
+                env, mushaf, files, bismillah
+            )
+        elif layout == "qcf_fixed_interactive":
+            if not config.translation:
+                raise ValueError("qcf_fixed_interactive layout requires a translation config")
+            translation_dir = get_language_direction(config.translation.language)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf_fixed_interactive(
+                env, mushaf, files, bismillah, config.translation.language, translation_dir
+            )
+        elif layout == "qcf_inline":
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_qcf(
+                env, mushaf, files, bismillah
+            )
+        elif layout == "wbw":
+            if not config.translation:
+                raise ValueError("wbw layout requires a translation config")
+            wbw_gloss_lang = config.layout.wbw_gloss_language or config.translation.language
+            wbw_gloss_dir = get_language_direction(wbw_gloss_lang)
+            translation_lang = config.translation.language
+            translation_dir = get_language_direction(translation_lang)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_wbw(
+                env, mushaf, files, bismillah, config,
+                wbw_gloss_lang, wbw_gloss_dir,
+                translation_lang, translation_dir,
+            )
+        elif layout == "interactive_inline":
+            if not config.translation:
+                raise ValueError("interactive_inline layout requires a translation config")
+            translation_dir = get_language_direction(config.translation.language)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_interactive(
+                env, mushaf, files, bismillah, config.translation.language, translation_dir
+            )
+        elif layout == "bilingual_interactive":
+            if not config.translation:
+                raise ValueError("bilingual_interactive layout requires a translation config")
+            if not config.tafsir:
+                raise ValueError("bilingual_interactive layout requires a tafsir config")
+            translation_dir = get_language_direction(config.translation.language)
+            tafsir_dir = get_language_direction(config.tafsir.language)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_bilingual_interactive(
+                env, mushaf, files, bismillah,
+                config.translation.language, translation_dir,
+                config.tafsir.language, tafsir_dir,
+            )
+        elif config.translation:
+            translation_dir = get_language_direction(config.translation.language)
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_bilingual(
+                env, mushaf, files, bismillah, config.translation.language, translation_dir
+            )
+        elif layout == "inline":
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_continuous(
+                env, mushaf, files, bismillah
+            )
+        else:
+            chapter_items, href_fn, page_href_fn, chapter_href = _build_by_surah(
+                env, mushaf, files, bismillah
+            )
 
-    click.echo(f"EPUB created: {output_path} ({len(epub_bytes):,} bytes)")
+        # TOC
+        juz_entries, page_list = _compute_nav_entries(
+            juz_starts, page_starts, href_fn, page_href_fn
+        )
+        toc_html = toc_template.render(
+            surahs=mushaf.surahs,
+            juz_entries=juz_entries,
+            page_list=page_list,
+            chapter_href=chapter_href,
+            is_bilingual=is_bilingual,
+            symbol_font_family=symbol_font_info.family,
+        )
+        files["OEBPS/toc.xhtml"] = toc_html.encode("utf-8")
+
+        # CSS
+        files["OEBPS/styles/base.css"] = css_bytes
+
+        # Fonts
+        files[f"OEBPS/fonts/{font_info.filename}"] = font_bytes
+        font_filenames = [font_info.filename]
+        if symbol_font_info.filename != font_info.filename:
+            files[f"OEBPS/fonts/{symbol_font_info.filename}"] = symbol_font_bytes
+            font_filenames.append(symbol_font_info.filename)
+        if basmala_font_info.filename not in font_filenames:
+            files[f"OEBPS/fonts/{basmala_font_info.filename}"] = basmala_font_bytes
+            font_filenames.append(basmala_font_info.filename)
+        if header_label_font_info.filename not in font_filenames:
+            files[f"OEBPS/fonts/{header_label_font_info.filename}"] = header_label_font_bytes
+            font_filenames.append(header_label_font_info.filename)
+        if surah_name_font_info.filename not in font_filenames:
+            files[f"OEBPS/fonts/{surah_name_font_info.filename}"] = surah_name_font_path
+            font_filenames.append(surah_name_font_info.filename)
+
+        # QCF per-page fonts (604 files)
+        if is_qcf:
+            click.echo(f"  Embedding {QCF_TOTAL_PAGES} QCF page fonts...")
+            for page_num, page_font_path in sorted(qcf_font_paths.items()):
+                fname = f"p{page_num}.ttf"
+                files[f"OEBPS/fonts/{fname}"] = page_font_path
+                font_filenames.append(fname)
+
+        # OPF
+        descriptive_title = _build_descriptive_title(config, subtitle)
+        opf = _render_package_opf(config, chapter_items, font_filenames, descriptive_title)
+        files["OEBPS/package.opf"] = opf.encode("utf-8")
+
+    click.echo(f"EPUB created: {output_path} ({output_path.stat().st_size:,} bytes)")
     return output_path
 
 
@@ -1255,13 +1373,14 @@ def _build_qcf_bilingual(env, mushaf, files, bismillah, translation_lang, transl
     chapter_items = []
     all_footnotes = _collect_footnotes(mushaf)
 
+    # Render variables shared by every surah, built once
+    chapter_ctx = {
+        "bismillah_text": bismillah,
+        "translation_lang": translation_lang,
+        "translation_dir": translation_dir,
+    }
     for surah in mushaf.surahs:
-        chapter_html = template.render(
-            surah=surah,
-            bismillah_text=bismillah,
-            translation_lang=translation_lang,
-            translation_dir=translation_dir,
-        )
+        chapter_html = template.render(chapter_ctx, surah=surah)
         files[f"OEBPS/chapter-{surah.number}.xhtml"] = chapter_html.encode("utf-8")
         chapter_items.append((f"chapter-{surah.number}", f"chapter-{surah.number}.xhtml"))
 
@@ -1299,16 +1418,7 @@ def _build_qcf_interactive(env, mushaf, files, bismillah, translation_lang, tran
         files[f"OEBPS/chapter-{surah.number}.xhtml"] = chapter_html.encode("utf-8")
         chapter_items.append((f"chapter-{surah.number}", f"chapter-{surah.number}.xhtml"))
 
-    translation_notes = []
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            if ayah.translation:
-                translation_notes.append({
-                    "surah": surah.number,
-                    "ayah": ayah.ayah_number,
-                    "text": _strip_noteref_links(ayah.translation),
-                    "footnotes": list(ayah.footnotes),
-                })
+    translation_notes = _collect_translation_notes(mushaf)
 
     endnotes_html = endnotes_template.render(
         translation_notes=translation_notes,
@@ -1425,16 +1535,7 @@ def _build_qcf_fixed_interactive(env, mushaf, files, bismillah, translation_lang
         files[f"OEBPS/chapter-{surah.number}.xhtml"] = chapter_html.encode("utf-8")
         chapter_items.append((f"chapter-{surah.number}", f"chapter-{surah.number}.xhtml"))
 
-    translation_notes = []
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            if ayah.translation:
-                translation_notes.append({
-                    "surah": surah.number,
-                    "ayah": ayah.ayah_number,
-                    "text": _strip_noteref_links(ayah.translation),
-                    "footnotes": list(ayah.footnotes),
-                })
+    translation_notes = _collect_translation_notes(mushaf)
 
     endnotes_html = endnotes_template.render(
         translation_notes=translation_notes,
@@ -1507,6 +1608,9 @@ def _build_continuous(env, mushaf, files, bismillah):
     return chapter_items, href_fn, page_href_fn, chapter_href
 
 
+_NOTEREF_LINK = re.compile(r'<a\s[^>]*class="noteref"[^>]*>(.*?)</a>')
+
+
 def _strip_noteref_links(text: str) -> str:
     """Replace <a> noteref links with plain <sup> for popup display.
 
@@ -1514,7 +1618,32 @@ def _strip_noteref_links(text: str) -> str:
     styling within popups. Converting noterefs to plain <sup> ensures footnote
     numbers display as superscripts in the popup.
     """
-    return re.sub(r'<a\s[^>]*class="noteref"[^>]*>(.*?)</a>', r'<sup>\1</sup>', text)
+    # Most verses have no footnotes: skip the regex scan entirely.
+    if "noteref" not in text:
+        return text
+    return _NOTEREF_LINK.sub(r'<sup>\1</sup>', text)
+
+
+def _collect_translation_notes(mushaf: Mushaf) -> list[dict]:
+    """Collect one endnote per translated ayah for the interactive layouts.
+
+    Each note carries the ayah's translation (noteref links flattened by
+    _strip_noteref_links) and its footnotes, so both show in one popup.
+    """
+    translation_notes = []
+    append = translation_notes.append
+    for surah in mushaf.surahs:
+        surah_number = surah.number
+        for ayah in surah.ayahs:
+            translation = ayah.translation
+            if translation:
+                append({
+                    "surah": surah_number,
+                    "ayah": ayah.ayah_number,
+                    "text": _strip_noteref_links(translation),
+                    "footnotes": list(ayah.footnotes),
+                })
+    return translation_notes
 
 
 def _build_interactive(env, mushaf, files, bismillah, translation_lang, translation_dir):
@@ -1539,17 +1668,7 @@ def _build_interactive(env, mushaf, files, bismillah, translation_lang, translat
     # Collect translation notes with inlined footnotes for endnotes.
     # Noteref links in translation text are replaced with plain <sup> tags,
     # and the footnote text is appended inline so everything shows in one popup.
-    translation_notes = []
-
-    for surah in mushaf.surahs:
-        for ayah in surah.ayahs:
-            if ayah.translation:
-                translation_notes.append({
-                    "surah": surah.number,
-                    "ayah": ayah.ayah_number,
-                    "text": _strip_noteref_links(ayah.translation),
-                    "footnotes": list(ayah.footnotes),
-                })
+    translation_notes = _collect_translation_notes(mushaf)
 
     # Render endnotes (translation notes with inlined footnotes, no separate footnote asides)
     endnotes_html = endnotes_template.render(
@@ -1586,13 +1705,14 @@ def _build_bilingual(env, mushaf, files, bismillah, translation_lang, translatio
     chapter_items = []
     all_footnotes = _collect_footnotes(mushaf)
 
+    # Render variables shared by every surah, built once
+    chapter_ctx = {
+        "bismillah_text": bismillah,
+        "translation_lang": translation_lang,
+        "translation_dir": translation_dir,
+    }
     for surah in mushaf.surahs:
-        chapter_html = template.render(
-            surah=surah,
-            bismillah_text=bismillah,
-            translation_lang=translation_lang,
-            translation_dir=translation_dir,
-        )
+        chapter_html = template.render(chapter_ctx, surah=surah)
         files[f"OEBPS/chapter-{surah.number}.xhtml"] = chapter_html.encode("utf-8")
         chapter_items.append((f"chapter-{surah.number}", f"chapter-{surah.number}.xhtml"))
 
@@ -1634,13 +1754,14 @@ def _build_bilingual_interactive(
     chapter_items = []
     all_footnotes = _collect_footnotes(mushaf)
 
+    # Render variables shared by every surah, built once
+    chapter_ctx = {
+        "bismillah_text": bismillah,
+        "translation_lang": translation_lang,
+        "translation_dir": translation_dir,
+    }
     for surah in mushaf.surahs:
-        chapter_html = template.render(
-            surah=surah,
-            bismillah_text=bismillah,
-            translation_lang=translation_lang,
-            translation_dir=translation_dir,
-        )
+        chapter_html = template.render(chapter_ctx, surah=surah)
         files[f"OEBPS/chapter-{surah.number}.xhtml"] = chapter_html.encode("utf-8")
         chapter_items.append((f"chapter-{surah.number}", f"chapter-{surah.number}.xhtml"))
 
@@ -1702,17 +1823,18 @@ def _build_wbw(
     chapter_items = []
     all_footnotes = _collect_footnotes(mushaf) if has_translation else []
 
+    # Render variables shared by every surah, built once
+    chapter_ctx = {
+        "bismillah_text": bismillah,
+        "show_transliteration": show_translit,
+        "show_translation": has_translation,
+        "translation_lang": translation_lang or "",
+        "translation_dir": translation_dir or "ltr",
+        "wbw_gloss_lang": wbw_gloss_lang,
+        "wbw_gloss_dir": wbw_gloss_dir,
+    }
     for surah in mushaf.surahs:
-        chapter_html = template.render(
-            surah=surah,
-            bismillah_text=bismillah,
-            show_transliteration=show_translit,
-            show_translation=has_translation,
-            translation_lang=translation_lang or "",
-            translation_dir=translation_dir or "ltr",
-            wbw_gloss_lang=wbw_gloss_lang,
-            wbw_gloss_dir=wbw_gloss_dir,
-        )
+        chapter_html = template.render(chapter_ctx, surah=surah)
         files[f"OEBPS/chapter-{surah.number}.xhtml"] = chapter_html.encode("utf-8")
         chapter_items.append((f"chapter-{surah.number}", f"chapter-{surah.number}.xhtml"))
 
@@ -1,14 +1,16 @@
 """Font download and management."""
 
-import io
+import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-import httpx
 
 from ..config.registry import FONTS, FontInfo
 from ..data.cache import get_cache_dir
+from ..data.http_client import FETCH_WORKERS, get_client
 
 # QCF per-page font CDN base URLs.
 # V4 = COLR v0 tajweed colors; V1 = plain (no color layers).
@@ -70,21 +72,50 @@ def get_font_path(font_key: str) -> Path:
     return cached
 
 
+def prefetch_fonts(font_keys: list[str]) -> None:
+    """Resolve several fonts at once, downloading missing ones concurrently.
+
+    Later ``get_font_path`` calls for these keys then hit the bundled
+    assets or the cache.
+    """
+    keys = list(dict.fromkeys(font_keys))
+    with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(keys)))) as pool:
+        # list() re-raises the first download error, if any
+        list(pool.map(get_font_path, keys))
+
+
 def _download_font(info: FontInfo, dest: Path) -> None:
-    """Download a font file from its source."""
-    click.echo(f"Downloading font: {info.family}...")
+    """Download a font file from its source.
 
-    resp = httpx.get(info.source_url, follow_redirects=True, timeout=120)
-    resp.raise_for_status()
+    The response is streamed to a temporary file next to ``dest`` and
+    renamed into place, so the font is never held in memory whole and an
+    interrupted download never leaves a truncated font in the cache.
+    """
+    click.echo(f"Downloading font: {info.family}...")
 
-    if info.zip_path:
-        # Font is inside a zip archive — extract the specific file
-        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
-            with zf.open(info.zip_path) as font_file:
-                dest.write_bytes(font_file.read())
-    else:
-        # Direct TTF download
-        dest.write_bytes(resp.content)
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+    try:
+        with get_client().stream("GET", info.source_url, timeout=120) as resp:
+            resp.raise_for_status()
+            with tmp.open("wb") as out:
+                for chunk in resp.iter_bytes():
+                    out.write(chunk)
+
+        if info.zip_path:
+            # Font is inside a zip archive — extract the specific file.
+            # ZipFile seeks within the downloaded archive on disk.
+            archive = tmp.with_name(f"{tmp.name}.zip")
+            tmp.replace(archive)
+            try:
+                with zipfile.ZipFile(archive) as zf:
+                    with zf.open(info.zip_path) as font_file, tmp.open("wb") as out:
+                        shutil.copyfileobj(font_file, out)
+            finally:
+                archive.unlink(missing_ok=True)
+
+        tmp.replace(dest)
+    finally:
+        tmp.unlink(missing_ok=True)
 
     click.echo(f"  Saved to {dest} ({dest.stat().st_size:,} bytes)")
 
@@ -105,14 +136,11 @@ def get_qcf_font_paths(font_key: str) -> dict[int, Path]:
     cache_dir = _fonts_dir() / font_key
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    paths: dict[int, Path] = {}
     to_download: list[int] = []
 
     for page in range(1, QCF_TOTAL_PAGES + 1):
         dest = cache_dir / f"p{page}.ttf"
-        if dest.exists() and dest.stat().st_size > 0:
-            paths[page] = dest
-        else:
+        if not (dest.exists() and dest.stat().st_size > 0):
             to_download.append(page)
 
     if not to_download:
@@ -120,16 +148,18 @@ def get_qcf_font_paths(font_key: str) -> dict[int, Path]:
         return {p: cache_dir / f"p{p}.ttf" for p in range(1, QCF_TOTAL_PAGES + 1)}
 
     click.echo(f"  Downloading {len(to_download)} QCF fonts ({font_key})...")
-    with httpx.Client(timeout=30, follow_redirects=True) as client:
-        for i, page in enumerate(to_download):
-            url = url_template.format(page=page)
-            dest = cache_dir / f"p{page}.ttf"
-            resp = client.get(url)
-            resp.raise_for_status()
-            dest.write_bytes(resp.content)
-            paths[page] = dest
-            if (i + 1) % 50 == 0 or (i + 1) == len(to_download):
-                click.echo(f"    {i + 1}/{len(to_download)} fonts downloaded")
+    client = get_client()
+
+    def download_page(page: int) -> None:
+        resp = client.get(url_template.format(page=page))
+        resp.raise_for_status()
+        (cache_dir / f"p{page}.ttf").write_bytes(resp.content)
+
+    # Pages download concurrently; results come back in submission order
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        for i, _ in enumerate(pool.map(download_page, to_download), 1):
+            if i % 50 == 0 or i == len(to_download):
+                click.echo(f"    {i}/{len(to_download)} fonts downloaded")
 
     total_size = sum((cache_dir / f"p{p}.ttf").stat().st_size for p in range(1, QCF_TOTAL_PAGES + 1))
     click.echo(f"  QCF fonts: {QCF_TOTAL_PAGES} files, {total_size / 1024 / 1024:.1f} MB total")
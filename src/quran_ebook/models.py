@@ -1,9 +1,16 @@
-"""Data models for Quran text."""
+"""Data models for Quran text.
 
-from pydantic import BaseModel
+Plain slotted dataclasses: a Mushaf holds ~6k ayahs (and ~80k words for
+word-by-word builds) that are built once from trusted, already-parsed
+data and then read many times while rendering, so per-object validation
+and a per-instance ``__dict__`` buy nothing.
+"""
 
+from dataclasses import asdict, dataclass, field
 
-class Footnote(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class Footnote:
     """A footnote attached to a translation."""
 
     id: int
@@ -11,7 +18,8 @@ class Footnote(BaseModel):
     text: str
 
 
-class Word(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Word:
     """A single word from the Quran with word-level translation/transliteration."""
 
     position: int
@@ -24,7 +32,8 @@ class Word(BaseModel):
     char_type: str = "word"  # "word" or "end" (ayah-end marker glyph)
 
 
-class Ayah(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Ayah:
     """A single verse of the Quran."""
 
     surah_number: int
@@ -37,13 +46,24 @@ class Ayah(BaseModel):
     hizb_marker: bool = False
     page_marker: int | None = None  # Set when this ayah starts a new mushaf page
     translation: str | None = None  # Translation text (footnote refs already replaced)
-    footnotes: list[Footnote] = []  # Footnotes referenced by this ayah's translation
+    footnotes: list[Footnote] = field(default_factory=list)  # Footnotes referenced by this ayah's translation
     tafsir: str | None = None  # Tafsir/mukhtasar text (shown in popup for bilingual+interactive)
-    tafsir_footnotes: list[Footnote] = []  # Footnotes from tafsir content
-    words: list[Word] = []  # Word-level data (populated when words=true)
-
-
-class Surah(BaseModel):
+    tafsir_footnotes: list[Footnote] = field(default_factory=list)  # Footnotes from tafsir content
+    words: list[Word] = field(default_factory=list)  # Word-level data (populated when words=true)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Ayah":
+        """Rebuild an ayah (and its footnotes and words) from ``asdict`` output."""
+        return cls(**{
+            **data,
+            "footnotes": [Footnote(**fn) for fn in data.get("footnotes", ())],
+            "tafsir_footnotes": [Footnote(**fn) for fn in data.get("tafsir_footnotes", ())],
+            "words": [Word(**w) for w in data.get("words", ())],
+        })
+
+
+@dataclass(slots=True, kw_only=True)
+class Surah:
     """A chapter of the Quran."""
 
     number: int
@@ -70,11 +90,26 @@ class Surah(BaseModel):
         """
         return self.number == 1 and self.basmala_is_first_ayah
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Surah":
+        """Rebuild a surah and its ayahs from ``asdict`` output."""
+        return cls(**{**data, "ayahs": [Ayah.from_dict(a) for a in data["ayahs"]]})
 
-class Mushaf(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class Mushaf:
     """A complete Quran text in a specific script."""
 
     surahs: list[Surah]
     script: str
-    metadata: dict = {}
+    metadata: dict = field(default_factory=dict)
     bismillah_text: str  # Extracted from Al-Fatiha 1:1 at load time (encoding-specific)
+
+    def to_dict(self) -> dict:
+        """Convert to plain dicts and lists (for the JSON cache)."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Mushaf":
+        """Rebuild a Mushaf from ``to_dict`` output."""
+        return cls(**{**data, "surahs": [Surah.from_dict(s) for s in data["surahs"]]})
@@ -6,60 +6,144 @@ Combines multiple data sources:
 2. EQTB (Extended Quranic Treebank) — root, lemma, POS, verb form, case/mood/tense per word
 3. aliozdenisik/quran-arabic-roots-lane-lexicon — Lane's Lexicon definitions per root
 
-Output: StarDict dictionary files (.ifo, .idx, .dict.dz) for use in KOReader.
+Output: StarDict dictionary files (.ifo, .idx, .syn, .dict.dz) for use in KOReader.
 
 Usage:
     python tools/build_dictionary.py [--output-dir OUTPUT_DIR] [--cache-dir CACHE_DIR]
 """
 
 import argparse
+import array
 import csv
 import gzip
+import importlib.util
 import json
+import os
 import re
 import struct
 import sys
-import time
+import warnings
+import zlib
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — stdlib json is used otherwise
+    orjson = None
+
 BASE_URL = "https://api.quran.com/api/v4"
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CACHE_DIR = PROJECT_ROOT / ".cache" / "dictionary"
 EQTB_PATH = PROJECT_ROOT / "docs" / "eqtb" / "Quranic.csv"
 LANES_PATH = PROJECT_ROOT / ".cache" / "lanes" / "quran_roots_lane.json"
 
+# Chapters fetched concurrently from the API (network-bound). Set
+# QURAN_EBOOK_FETCH_WORKERS lower (e.g. 1) to go easier on the server.
+_DEFAULT_FETCH_WORKERS = 16
+
+
+def _fetch_workers() -> int:
+    """Read QURAN_EBOOK_FETCH_WORKERS, falling back to the default if invalid."""
+    raw = os.environ.get("QURAN_EBOOK_FETCH_WORKERS")
+    if raw is None:
+        return _DEFAULT_FETCH_WORKERS
+    try:
+        workers = int(raw)
+    except ValueError:
+        warnings.warn(
+            f"Ignoring non-integer QURAN_EBOOK_FETCH_WORKERS={raw!r}; "
+            f"using {_DEFAULT_FETCH_WORKERS}",
+            stacklevel=2,
+        )
+        return _DEFAULT_FETCH_WORKERS
+    return max(1, workers)
+
+
+FETCH_WORKERS = _fetch_workers()
+
+# HTTP/2 multiplexes the concurrent requests over one connection; it needs
+# the optional h2 package (pip install "httpx[http2]").
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
 # ---------------------------------------------------------------------------
 # Caching helpers
 # ---------------------------------------------------------------------------
 
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> bytes:
+    """Encode a value as UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def cache_get(cache_dir: Path, key: str):
     path = cache_dir / f"{key}.json"
     if path.exists():
-        return json.loads(path.read_text("utf-8"))
+        return _json_loads(path.read_bytes())
     return None
 
 
 def cache_set(cache_dir: Path, key: str, data):
     cache_dir.mkdir(parents=True, exist_ok=True)
-    (cache_dir / f"{key}.json").write_text(json.dumps(data, ensure_ascii=False), "utf-8")
+    (cache_dir / f"{key}.json").write_bytes(_json_dumps(data))
 
 
 # ---------------------------------------------------------------------------
 # Data fetching
 # ---------------------------------------------------------------------------
 
+def _prune_wbw_verses(verses: list[dict]) -> list[dict]:
+    """Reduce WBW verses to what the dictionary builders read.
+
+    Drops ayah-end marker entries and unused word fields, so cached
+    chapters are a fraction of the API response and their words need no
+    filtering when read back. char_type_name is kept because
+    build_grammar_dictionary.py reads the same cache and filters on it.
+    """
+    return [
+        {
+            "verse_key": v.get("verse_key"),
+            "words": [
+                {
+                    "char_type_name": "word",
+                    "translation": {"text": w.get("translation", {}).get("text", "")},
+                    "transliteration": {"text": w.get("transliteration", {}).get("text", "")},
+                }
+                for w in v.get("words", [])
+                if w.get("char_type_name") == "word"
+            ],
+        }
+        for v in verses
+    ]
+
+
 def fetch_wbw_chapter(client: httpx.Client, chapter: int, cache_dir: Path) -> tuple[list[dict], bool]:
     """Fetch word-by-word data for a chapter from Quran.com API.
 
-    Returns (list of verse dicts, from_cache).
+    Returns (list of verse dicts, from_cache). Verses are pruned by
+    _prune_wbw_verses: their words are real words only.
     """
     cache_key = f"wbw_ch{chapter}"
     cached = cache_get(cache_dir, cache_key)
     if cached:
+        # Caches written before pruning still hold full API responses
+        # (every verse ends with an ayah-end marker); prune and rewrite once
+        if any(w.get("char_type_name") != "word" for w in cached[0].get("words", [])):
+            cached = _prune_wbw_verses(cached)
+            cache_set(cache_dir, cache_key, cached)
         return cached, True
 
     all_verses = []
@@ -75,12 +159,13 @@ def fetch_wbw_chapter(client: httpx.Client, chapter: int, cache_dir: Path) -> tu
             },
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         all_verses.extend(data["verses"])
         if data.get("pagination", {}).get("next_page") is None:
             break
         page += 1
 
+    all_verses = _prune_wbw_verses(all_verses)
     cache_set(cache_dir, cache_key, all_verses)
     return all_verses, False
 
@@ -108,7 +193,7 @@ def fetch_qpc_chapter(client: httpx.Client, chapter: int, cache_dir: Path) -> tu
             },
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp.content)
         all_verses.extend(data["verses"])
         if data.get("pagination", {}).get("next_page") is None:
             break
@@ -118,6 +203,22 @@ def fetch_qpc_chapter(client: httpx.Client, chapter: int, cache_dir: Path) -> tu
     return all_verses, False
 
 
+def fetch_all_chapters(
+    client: httpx.Client, cache_dir: Path,
+) -> list[tuple[list[dict], bool, list[dict], bool]]:
+    """Fetch QPC text and WBW data for all 114 chapters concurrently.
+
+    Returns (qpc_verses, qpc_cached, wbw_verses, wbw_cached) per chapter,
+    in chapter order.
+    """
+    def fetch_chapter(chapter: int):
+        return (*fetch_qpc_chapter(client, chapter, cache_dir),
+                *fetch_wbw_chapter(client, chapter, cache_dir))
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        return list(pool.map(fetch_chapter, range(1, 115)))
+
+
 # ---------------------------------------------------------------------------
 # Morphology parsing
 # ---------------------------------------------------------------------------
@@ -158,14 +259,15 @@ def _bidi_paren(ar: str) -> str:
     return f"\u200E({ar}\u200E)"
 
 
-def load_morphology(path: Path) -> dict[str, dict]:
+def load_morphology(path: Path) -> dict[int, dict]:
     """Load per-word morphology from EQTB (Extended Quranic Treebank).
 
     Extracts STEM segment data for each word. STEM carries the word's primary
     POS, root, lemma, case, mood, tense, gender, number, person, verb form,
     and derived noun form — the same fields previously parsed from mustafa0x.
 
-    Returns dict keyed by "surah:ayah:word" -> {
+    Returns dict keyed by the packed word position
+    (surah << 18) | (ayah << 9) | word -> {
         "root": str or None,
         "lemma": str or None,
         "pos": str,  # N, V, P, PN, PRON, ADJ, etc.
@@ -183,14 +285,20 @@ def load_morphology(path: Path) -> dict[str, dict]:
         print(f"WARNING: EQTB file not found: {path}")
         return {}
 
-    words: dict[str, dict] = {}
-
-    with open(path, "r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        for row in reader:
-            # Only extract morphology from STEM segments
-            if row.get("segment") != "STEM":
+    words: dict[int, dict] = {}
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader, [])
+        if "segment" not in header:
+            return words
+        seg_col = header.index("segment")
+        for fields in reader:
+            # Only extract morphology from STEM segments; skip the rest
+            # before paying for a per-row dict
+            if len(fields) <= seg_col or fields[seg_col] != "STEM":
                 continue
+            row = dict(zip(header, fields))
             loc = _eqtb_val(row, "location")
             if not loc:
                 continue
@@ -198,7 +306,7 @@ def load_morphology(path: Path) -> dict[str, dict]:
             parts = loc.strip("()").split(":")
             if len(parts) < 3:
                 continue
-            word_key = f"{parts[0]}:{parts[1]}:{parts[2]}"
+            word_key = (int(parts[0]) << 18) | (int(parts[1]) << 9) | int(parts[2])
 
             # First STEM per word wins (same as grammar dictionary)
             if word_key in words:
@@ -244,7 +352,7 @@ def load_lanes(path: Path) -> dict[str, dict]:
         print(f"WARNING: Lane's Lexicon file not found: {path}")
         return {}
 
-    data = json.loads(path.read_text("utf-8"))
+    data = _json_loads(path.read_bytes())
     roots = {}
     for entry in data.get("roots", []):
         root = entry.get("root", "")
@@ -283,7 +391,7 @@ _PAUSE_MARKS = frozenset({
     "\u0615",  # Small high tah
     "\u0617",  # Small high zain
 })
-_PAUSE_RE = re.compile("[" + "".join(_PAUSE_MARKS) + "]+$")
+_PAUSE_CHARS = "".join(sorted(_PAUSE_MARKS))
 
 # QPC repurposes three Unicode codepoints for tanween variants — the QPC font
 # has custom glyphs, but standard Arabic fonts (including KOReader's dictionary
@@ -303,7 +411,7 @@ def normalize_qpc_tanween(text: str) -> str:
 
 def strip_pause_marks(word: str) -> str:
     """Strip trailing QPC pause marks from a word."""
-    return _PAUSE_RE.sub("", word)
+    return word.rstrip(_PAUSE_CHARS)
 
 
 def extract_qpc_words(qpc_text: str) -> list[str]:
@@ -575,7 +683,7 @@ def build_entry_html(
     transliteration: str | None,
     morph: dict | None,
     lane_root: dict | None,
-    locations: list[str],
+    locations: Sequence[int],
     *,
     instance_ref: str | None = None,
     lemma_count: int | None = None,
@@ -583,24 +691,17 @@ def build_entry_html(
 ) -> str:
     """Build HTML content for a single dictionary entry.
 
-    In instance mode, instance_ref is the S:A:W key (hidden comment for plugin
-    matching) and lemma_count is the total occurrences of this lemma in the Quran.
+    translations must already be stripped and deduplicated. locations are
+    verse references packed as (surah << 9) | ayah. In instance
+    mode, instance_ref is the S:A:W key (hidden comment for plugin matching)
+    and lemma_count is the total occurrences of this lemma in the Quran.
     """
     parts = []
     ref_prefix = f"<!-- ref:{instance_ref} -->" if instance_ref else ""
 
-    # Translation(s) — deduplicated
-    unique_trans = []
-    seen = set()
-    for t in translations:
-        t_clean = t.strip()
-        t_lower = t_clean.lower()
-        if t_lower not in seen and t_clean:
-            seen.add(t_lower)
-            unique_trans.append(t_clean)
-
-    if unique_trans:
-        parts.append(ref_prefix + "; ".join(unique_trans))
+    # Translation(s)
+    if translations:
+        parts.append(ref_prefix + "; ".join(translations))
         ref_prefix = ""  # consumed
 
     # Transliteration
@@ -629,8 +730,7 @@ def build_entry_html(
             parts.append(f'<span style="color:#666;font-size:80%">Occurences: {", ".join(occ_parts)}</span>')
     elif locations:
         count = len(locations)
-        sample = locations[:5]
-        loc_str = ", ".join(sample)
+        loc_str = ", ".join(f"{loc >> 9}:{loc & 0x1FF}" for loc in locations[:5])
         if count > 5:
             loc_str += f" … ({count} total)"
         elif count > 1:
@@ -647,51 +747,104 @@ def build_entry_html(
 # StarDict writer
 # ---------------------------------------------------------------------------
 
-def write_stardict(entries: list[tuple[str, str]], output_dir: Path, dict_name: str,
+# .idx record tail: definition offset and size, both 32-bit big-endian
+_IDX_PACKER = struct.Struct(">II")
+# .syn record tail: index of the target .idx entry, 32-bit big-endian
+_SYN_PACKER = struct.Struct(">I")
+
+# dictzip chunk size (uncompressed bytes), the dictzip(1) default
+_DZ_CHUNK_LEN = 58315
+
+
+def dictzip(dict_path: Path) -> Path:
+    """Compress a .dict file to .dict.dz, replacing it (like dictzip(1)).
+
+    A .dict.dz is a gzip file whose deflate stream is fully flushed every
+    _DZ_CHUNK_LEN input bytes, with each chunk's compressed size listed in
+    an "RA" extra header field so readers can seek to any definition.
+    """
+    size = dict_path.stat().st_size
+    chunk_count = -(-size // _DZ_CHUNK_LEN)
+    dz_path = dict_path.with_name(dict_path.name + ".dz")
+
+    with open(dict_path, "rb") as src, open(dz_path, "wb") as dst:
+        # gzip header: FEXTRA flag, zero mtime, max-compression XFL, Unix OS
+        dst.write(struct.pack("<BBBBIBBH", 0x1F, 0x8B, 8, 0x04, 0, 2, 3, 10 + 2 * chunk_count))
+        # RA subfield: version 1, chunk length, chunk count, then the sizes
+        dst.write(b"RA" + struct.pack("<HHHH", 6 + 2 * chunk_count, 1, _DZ_CHUNK_LEN, chunk_count))
+        sizes_offset = dst.tell()
+        dst.write(bytes(2 * chunk_count))  # patched below
+
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+        crc = 0
+        chunk_sizes = []
+        while chunk := src.read(_DZ_CHUNK_LEN):
+            crc = zlib.crc32(chunk, crc)
+            data = compressor.compress(chunk) + compressor.flush(zlib.Z_FULL_FLUSH)
+            chunk_sizes.append(len(data))
+            dst.write(data)
+        dst.write(compressor.flush())
+        dst.write(struct.pack("<II", crc, size & 0xFFFFFFFF))
+
+        dst.seek(sizes_offset)
+        dst.write(struct.pack(f"<{chunk_count}H", *chunk_sizes))
+
+    dict_path.unlink()
+    return dz_path
+
+
+def write_stardict(entries: list[tuple[str, bytes, list[str]]], output_dir: Path, dict_name: str,
                     bookname: str = "Quran Word-by-Word (QPC Uthmani Hafs)"):
     """Write StarDict dictionary files.
 
-    entries: list of (headword, html_definition) tuples.
+    entries: list of (headword, html_definition, synonyms) tuples, the
+    definition already UTF-8 encoded. Synonyms (alternative spellings of
+    the headword) go to the .syn file, pointing at their entry.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # StarDict requires .idx entries sorted by headword UTF-8 bytes
-    entries.sort(key=lambda e: e[0].encode("utf-8"))
-
-    # Build .dict content and .idx entries
-    dict_data = bytearray()
-    idx_entries = []
-
-    for headword, definition in entries:
-        def_bytes = definition.encode("utf-8")
-        offset = len(dict_data)
-        size = len(def_bytes)
-        dict_data.extend(def_bytes)
+    # StarDict requires .idx entries sorted by headword UTF-8 bytes; encode
+    # each headword once and sort on the bytes themselves
+    encoded = [(headword.encode("utf-8"), def_bytes, syns) for headword, def_bytes, syns in entries]
+    encoded.sort(key=lambda e: e[0])
 
-        hw_bytes = headword.encode("utf-8")
-        # idx entry: headword\0 + offset(4 bytes big-endian) + size(4 bytes big-endian)
-        idx_entry = hw_bytes + b"\x00" + struct.pack(">II", offset, size)
-        idx_entries.append(idx_entry)
-
-    # Write .dict (uncompressed — KOReader requires dictzip for .dict.dz,
-    # which needs random-access headers that Python's gzip doesn't produce)
+    # Stream .dict and .idx entry by entry; offsets are tracked as we go.
+    # Identical definitions are stored once and share an offset.
+    # .dict is dictzipped afterwards (plain gzip has no random access).
     dict_path = output_dir / f"{dict_name}.dict"
-    with open(dict_path, "wb") as f:
-        f.write(bytes(dict_data))
-
-    # Write .idx
     idx_path = output_dir / f"{dict_name}.idx"
-    with open(idx_path, "wb") as f:
-        for entry in idx_entries:
-            f.write(entry)
+    dict_size = 0
+    idx_size = 0
+    offsets: dict[bytes, int] = {}
+    synonyms: list[tuple[bytes, int]] = []  # (synonym, .idx entry index)
+
+    with open(dict_path, "wb") as dict_f, open(idx_path, "wb") as idx_f:
+        for index, (hw_bytes, def_bytes, entry_synonyms) in enumerate(encoded):
+            synonyms.extend((syn.encode("utf-8"), index) for syn in entry_synonyms)
+            offset = offsets.get(def_bytes)
+            if offset is None:
+                offset = offsets[def_bytes] = dict_size
+                dict_f.write(def_bytes)
+                dict_size += len(def_bytes)
+
+            # idx entry: headword\0 + offset(4 bytes big-endian) + size(4 bytes big-endian)
+            idx_entry = hw_bytes + b"\x00" + _IDX_PACKER.pack(offset, len(def_bytes))
+            idx_f.write(idx_entry)
+            idx_size += len(idx_entry)
+
+    # Write .syn, sorted like .idx: synonym\0 + entry index (4 bytes big-endian)
+    synonyms.sort(key=lambda s: s[0])
+    with open(output_dir / f"{dict_name}.syn", "wb") as syn_f:
+        for syn, index in synonyms:
+            syn_f.write(syn + b"\x00" + _SYN_PACKER.pack(index))
 
     # Write .ifo
-    idx_size = sum(len(e) for e in idx_entries)
     ifo_path = output_dir / f"{dict_name}.ifo"
     ifo_content = (
         "StarDict's dict ifo file\n"
         "version=2.4.2\n"
         f"wordcount={len(entries)}\n"
+        f"synwordcount={len(synonyms)}\n"
         f"idxfilesize={idx_size}\n"
         f"bookname={bookname}\n"
         f"description=Quran word-by-word English dictionary with morphology, transliteration, and Lane's Lexicon root definitions. Headwords use QPC Uthmani Hafs encoding.\n"
@@ -700,17 +853,14 @@ def write_stardict(entries: list[tuple[str, str]], output_dir: Path, dict_name:
     )
     ifo_path.write_text(ifo_content, "utf-8")
 
-    # Optionally compress with dictzip if available (produces .dict.dz with
-    # random-access headers that KOReader can seek into)
-    import shutil
-    import subprocess as sp
-    if shutil.which("dictzip"):
-        sp.run(["dictzip", str(dict_path)], check=True)
-        print(f"  Compressed with dictzip → {dict_name}.dict.dz")
+    # Compress to .dict.dz, which KOReader can seek into
+    dictzip(dict_path)
+    print(f"  Compressed with dictzip → {dict_name}.dict.dz")
 
     print(f"StarDict written: {output_dir / dict_name}.*")
     print(f"  Entries: {len(entries)}")
-    print(f"  Dict size: {len(dict_data):,} bytes")
+    print(f"  Synonyms: {len(synonyms)}")
+    print(f"  Dict size: {dict_size:,} bytes")
     print(f"  Idx size: {idx_size:,} bytes")
 
 
@@ -745,17 +895,34 @@ def main():
     cache_dir = Path(args.cache_dir)
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    # Step 1: Load morphology from EQTB
-    print(f"Loading morphology data (EQTB)...")
+    # Steps 1-3: parse morphology (EQTB) and Lane's Lexicon on worker
+    # threads while the QPC text + WBW data for all 114 surahs is loaded
+    # (network-bound on a cold cache)
+    print("Loading morphology (EQTB), Lane's Lexicon and Quran.com API data (QPC text + word-by-word)...")
     print(f"  {EQTB_PATH}")
-    morphology = load_morphology(EQTB_PATH)
-    print(f"  {len(morphology)} word entries")
-
-    # Step 2: Load Lane's Lexicon
-    print(f"Loading Lane's Lexicon root definitions...")
     print(f"  {LANES_PATH}")
-    lanes = load_lanes(LANES_PATH)
+    print(f"  Cache: {cache_dir}")
+    with ThreadPoolExecutor(max_workers=2) as loaders:
+        morphology_future = loaders.submit(load_morphology, EQTB_PATH)
+        lanes_future = loaders.submit(load_lanes, LANES_PATH)
+        with httpx.Client(timeout=30, http2=_HTTP2) as client:
+            chapters = fetch_all_chapters(client, cache_dir)
+        morphology = morphology_future.result()
+        lanes = lanes_future.result()
+
+    print(f"  {len(morphology)} word entries")
     print(f"  {len(lanes)} root entries")
+    cached_count = sum(qpc_cached + wbw_cached for _, qpc_cached, _, wbw_cached in chapters)
+    fetched_count = 2 * len(chapters) - cached_count
+    if fetched_count:
+        print(f"  {cached_count} cached, {fetched_count} fetched from API")
+    else:
+        print(f"  All {cached_count} requests served from cache")
+
+    # Resolve each word's Lane's entry once, so the word loops below need
+    # no root lookups
+    for morph in morphology.values():
+        morph["lane"] = lanes.get(morph["root"])
 
     if args.instance:
         # Per-instance mode: one entry per word occurrence
@@ -769,51 +936,44 @@ def main():
 
         # Pass 1: collect per-instance data (no HTML yet — need exact counts first)
         print(f"\nBuilding per-instance dictionary...")
-        print(f"  Loading QPC + WBW data from cache...")
         instances = []  # (canonical, headword, qpc_word, morph_key, translation, transliteration, morph, lane_root)
         form_counts: dict[str, int] = defaultdict(int)  # exact form occurrence count
 
-        with httpx.Client(timeout=30) as client:
-            for ch in range(1, 115):
-                qpc_verses, _ = fetch_qpc_chapter(client, ch, cache_dir)
-                wbw_verses, _ = fetch_wbw_chapter(client, ch, cache_dir)
+        for ch, (qpc_verses, _, wbw_verses, _) in enumerate(chapters, 1):
+            if len(qpc_verses) != len(wbw_verses):
+                print(f"  WARNING: Chapter {ch} verse count mismatch")
+                continue
 
-                if len(qpc_verses) != len(wbw_verses):
-                    print(f"  WARNING: Chapter {ch} verse count mismatch")
+            for qpc_v, wbw_v in zip(qpc_verses, wbw_verses):
+                verse_key = qpc_v["verse_key"]
+                qpc_text = qpc_v.get("qpc_uthmani_hafs", "")
+                if not qpc_text:
                     continue
 
-                for qpc_v, wbw_v in zip(qpc_verses, wbw_verses):
-                    verse_key = qpc_v["verse_key"]
-                    qpc_text = qpc_v.get("qpc_uthmani_hafs", "")
-                    if not qpc_text:
-                        continue
-
-                    qpc_words = extract_qpc_words(qpc_text)
-                    wbw_words = [w for w in wbw_v.get("words", [])
-                                 if w.get("char_type_name") == "word"]
-                    surah, ayah = verse_key.split(":")
+                qpc_words = extract_qpc_words(qpc_text)
+                wbw_words = wbw_v["words"]
+                surah, ayah = verse_key.split(":")
+                verse_base = (int(surah) << 18) | (int(ayah) << 9)  # morphology key
 
-                    for i, qpc_word in enumerate(qpc_words):
-                        if i >= len(wbw_words):
-                            break
+                for i, qpc_word in enumerate(qpc_words):
+                    if i >= len(wbw_words):
+                        break
 
-                        wbw = wbw_words[i]
-                        translation = wbw.get("translation", {}).get("text", "")
-                        transliteration = wbw.get("transliteration", {}).get("text", "")
+                    wbw = wbw_words[i]
+                    translation = (wbw.get("translation", {}).get("text") or "").strip()
+                    transliteration = wbw.get("transliteration", {}).get("text", "")
 
-                        headword = normalize_qpc_tanween(qpc_word)
-                        canonical = strip_pause_marks(headword)
+                    headword = normalize_qpc_tanween(qpc_word)
+                    canonical = strip_pause_marks(headword)
 
-                        word_pos = i + 1
-                        morph_key = f"{surah}:{ayah}:{word_pos}"
-                        morph = morphology.get(morph_key)
-                        lane_root = None
-                        if morph and morph.get("root") and morph["root"] in lanes:
-                            lane_root = lanes[morph["root"]]
+                    word_pos = i + 1
+                    morph_key = f"{surah}:{ayah}:{word_pos}"
+                    morph = morphology.get(verse_base | word_pos)
+                    lane_root = morph["lane"] if morph else None
 
-                        instances.append((canonical, headword, qpc_word, morph_key,
-                                          translation, transliteration, morph, lane_root))
-                        form_counts[canonical] += 1
+                    instances.append((canonical, headword, qpc_word, morph_key,
+                                      translation, transliteration, morph, lane_root))
+                    form_counts[canonical] += 1
 
         print(f"  {len(instances)} word instances")
 
@@ -859,13 +1019,12 @@ def main():
         entries = []
         for (canonical, html_body), refs in grouped.items():
             ref_comment = f"<!-- ref:{','.join(refs)} -->"
-            html = ref_comment + html_body
-            entries.append((canonical, html))
-            for variant in sorted(group_variants.get((canonical, html_body), set())):
-                entries.append((variant, html))
+            html = (ref_comment + html_body).encode("utf-8")
+            # Variant headwords become .syn synonyms of this entry
+            entries.append((canonical, html, list(group_variants.get((canonical, html_body), ()))))
 
         print(f"  {len(grouped)} unique entries (from {len(instances)} instances)")
-        print(f"  {len(entries)} total entries (including synonyms)")
+        print(f"  {sum(len(e[2]) for e in entries)} synonyms")
 
         print(f"\nWriting StarDict ({len(entries)} entries)...")
         write_stardict(entries, output_dir, args.dict_name,
@@ -874,141 +1033,94 @@ def main():
         print(f"Output: {output_dir}/{args.dict_name}.*")
         return
 
-    # Step 3: Fetch QPC text + WBW from API for all 114 surahs
-    # Build a word database: QPC headword -> {translations, transliteration, morphology, locations}
-    word_db: dict[str, dict] = defaultdict(lambda: {
-        "translations": [],
-        "transliteration": None,
-        "morph": None,
-        "root": None,
-        "locations": [],
-        "qpc_originals": set(),  # original QPC forms (before tanween normalization)
-    })
-
-    print(f"Loading Quran.com API data (QPC text + word-by-word)...")
-    print(f"  Cache: {cache_dir}")
-    cached_count = 0
-    fetched_count = 0
-    with httpx.Client(timeout=30) as client:
-        for ch in range(1, 115):
-            # Fetch QPC verse text and WBW data
-            qpc_verses, qpc_cached = fetch_qpc_chapter(client, ch, cache_dir)
-            wbw_verses, wbw_cached = fetch_wbw_chapter(client, ch, cache_dir)
-            cached_count += qpc_cached + wbw_cached
-            fetched_count += (not qpc_cached) + (not wbw_cached)
-
-            if len(qpc_verses) != len(wbw_verses):
-                print(f"  WARNING: Chapter {ch} verse count mismatch: QPC={len(qpc_verses)}, WBW={len(wbw_verses)}")
+    # Step 4: Build a word database keyed by canonical headword (words that differ
+    # only by trailing pause marks are merged):
+    # headword -> {translations, transliteration, morphology, locations}
+    word_db: dict[str, dict] = {}
+
+    print("\nCollecting words...")
+    for ch, (qpc_verses, _, wbw_verses, _) in enumerate(chapters, 1):
+        if len(qpc_verses) != len(wbw_verses):
+            print(f"  WARNING: Chapter {ch} verse count mismatch: QPC={len(qpc_verses)}, WBW={len(wbw_verses)}")
+            continue
+
+        for qpc_v, wbw_v in zip(qpc_verses, wbw_verses):
+            verse_key = qpc_v["verse_key"]
+            qpc_text = qpc_v.get("qpc_uthmani_hafs", "")
+            if not qpc_text:
                 continue
 
-            for qpc_v, wbw_v in zip(qpc_verses, wbw_verses):
-                verse_key = qpc_v["verse_key"]
-                qpc_text = qpc_v.get("qpc_uthmani_hafs", "")
-                if not qpc_text:
-                    continue
-
-                qpc_words = extract_qpc_words(qpc_text)
-                wbw_words = [w for w in wbw_v.get("words", []) if w.get("char_type_name") == "word"]
-
-                # Map by position
-                for i, qpc_word in enumerate(qpc_words):
-                    if i >= len(wbw_words):
-                        break
-
-                    wbw = wbw_words[i]
-                    translation = wbw.get("translation", {}).get("text", "")
-                    transliteration = wbw.get("transliteration", {}).get("text", "")
-
-                    # Normalize QPC-repurposed tanween codepoints so headwords
-                    # render correctly in standard Arabic fonts (dictionary popup)
-                    headword = normalize_qpc_tanween(qpc_word)
-
-                    entry = word_db[headword]
-                    if qpc_word != headword:
-                        entry["qpc_originals"].add(qpc_word)
-                    if translation:
-                        entry["translations"].append(translation)
-                    if transliteration and not entry["transliteration"]:
-                        entry["transliteration"] = transliteration
-                    entry["locations"].append(verse_key)
-
-                    # Morphology lookup (1-indexed word position)
-                    surah, ayah = verse_key.split(":")
-                    morph_key = f"{surah}:{ayah}:{i+1}"
-                    if morph_key in morphology and not entry["morph"]:
-                        entry["morph"] = morphology[morph_key]
-                        # Also look up Lane's root
-                        root = morphology[morph_key].get("root")
-                        if root and root in lanes:
-                            entry["root"] = root
-
-            # Rate limiting
-            time.sleep(0.05)
-
-    if fetched_count:
-        print(f"  {cached_count} cached, {fetched_count} fetched from API")
-    else:
-        print(f"  All {cached_count} requests served from cache")
-
-    print(f"\nTotal raw unique headwords: {len(word_db)}")
-
-    # Step 4: Normalize headwords — merge words that differ only by trailing pause marks
-    print("Normalizing headwords (merging pause mark variants)...")
-    canonical_db: dict[str, dict] = defaultdict(lambda: {
-        "translations": [],
-        "transliteration": None,
-        "morph": None,
-        "root": None,
-        "locations": [],
-        "variants": set(),  # original forms with pause marks
-        "qpc_synonyms": set(),  # original QPC forms for backward compat
-    })
-
-    for headword, data in word_db.items():
-        canonical = strip_pause_marks(headword)
-        entry = canonical_db[canonical]
-        entry["translations"].extend(data["translations"])
-        if data["transliteration"] and not entry["transliteration"]:
-            entry["transliteration"] = data["transliteration"]
-        if data["morph"] and not entry["morph"]:
-            entry["morph"] = data["morph"]
-        if data["root"] and not entry["root"]:
-            entry["root"] = data["root"]
-        entry["locations"].extend(data["locations"])
-        if headword != canonical:
-            entry["variants"].add(headword)
-        # Collect original QPC forms (with and without pause marks) as synonyms
-        for qpc_orig in data["qpc_originals"]:
-            entry["qpc_synonyms"].add(qpc_orig)
-            qpc_canonical = strip_pause_marks(qpc_orig)
-            if qpc_canonical != qpc_orig:
-                entry["qpc_synonyms"].add(qpc_canonical)
-
-    print(f"  Canonical headwords: {len(canonical_db)}")
-    variant_count = sum(len(v["variants"]) for v in canonical_db.values())
+            qpc_words = extract_qpc_words(qpc_text)
+            wbw_words = wbw_v["words"]
+            surah, ayah = verse_key.split(":")
+            # Packed verse reference: surah <= 114 and ayah <= 286 fit in 7 + 9 bits
+            location = (int(surah) << 9) | int(ayah)
+            verse_base = location << 9  # morphology key, word position added below
+
+            # Map by position
+            for i, qpc_word in enumerate(qpc_words):
+                if i >= len(wbw_words):
+                    break
+
+                wbw = wbw_words[i]
+                translation = (wbw.get("translation", {}).get("text") or "").strip()
+                transliteration = wbw.get("transliteration", {}).get("text", "")
+
+                # Normalize QPC-repurposed tanween codepoints so headwords
+                # render correctly in standard Arabic fonts (dictionary popup)
+                headword = normalize_qpc_tanween(qpc_word)
+                canonical = strip_pause_marks(headword)
+
+                entry = word_db.get(canonical)
+                if entry is None:
+                    entry = word_db[canonical] = {
+                        "translations": {},  # lowercased -> first spelling seen
+                        "transliteration": None,
+                        "morph": None,
+                        "locations": array.array("H"),  # packed (surah << 9) | ayah
+                        "variants": set(),  # forms with pause marks
+                        "qpc_synonyms": set(),  # original QPC forms for backward compat
+                    }
+                if headword != canonical:
+                    entry["variants"].add(headword)
+                # Collect original QPC forms (with and without pause marks) as synonyms
+                if qpc_word != headword:
+                    entry["qpc_synonyms"].add(qpc_word)
+                    qpc_canonical = strip_pause_marks(qpc_word)
+                    if qpc_canonical != qpc_word:
+                        entry["qpc_synonyms"].add(qpc_canonical)
+                if translation:
+                    entry["translations"].setdefault(translation.lower(), translation)
+                if transliteration and not entry["transliteration"]:
+                    entry["transliteration"] = transliteration
+                entry["locations"].append(location)
+
+                # Morphology lookup (1-indexed word position); the first
+                # occurrence with morphology wins
+                if not entry["morph"]:
+                    entry["morph"] = morphology.get(verse_base | (i + 1))
+
+    print(f"  Canonical headwords: {len(word_db)}")
+    variant_count = sum(len(v["variants"]) for v in word_db.values())
     print(f"  Pause mark variants: {variant_count}")
-    qpc_synonym_count = sum(len(v["qpc_synonyms"]) for v in canonical_db.values())
+    qpc_synonym_count = sum(len(v["qpc_synonyms"]) for v in word_db.values())
     print(f"  QPC tanween synonyms: {qpc_synonym_count}")
 
-    # Step 5: Build dictionary entries
+    # Step 5: Build dictionary entries (write_stardict sorts them)
     print("Building dictionary entries...")
     entries = []
-    for headword, data in sorted(canonical_db.items()):
-        lane_root = lanes.get(data["root"]) if data["root"] else None
+    for headword, data in word_db.items():
+        morph = data["morph"]
         html = build_entry_html(
-            translations=data["translations"],
+            translations=list(data["translations"].values()),
             transliteration=data["transliteration"],
-            morph=data["morph"],
-            lane_root=lane_root,
+            morph=morph,
+            lane_root=morph["lane"] if morph else None,
             locations=data["locations"],
-        )
-        entries.append((headword, html))
-        # Add synonym entries for pause-marked variants pointing to same definition
-        for variant in sorted(data["variants"]):
-            entries.append((variant, html))
-        # Add QPC original forms as synonyms for non-plugin users
-        for qpc_syn in sorted(data["qpc_synonyms"]):
-            entries.append((qpc_syn, html))
+        ).encode("utf-8")
+        # Synonyms: pause-marked variants, plus the original QPC forms for
+        # non-plugin users
+        entries.append((headword, html, [*data["variants"], *data["qpc_synonyms"]]))
 
     # Step 6: Write StarDict
     print(f"\nWriting StarDict ({len(entries)} entries)...")
@@ -1016,7 +1128,7 @@ def main():
 
     print("\nDone!")
     print(f"Output: {output_dir}/{args.dict_name}.*")
-    print("Copy the .ifo, .idx, and .dict.dz files to your KOReader dictionaries folder.")
+    print("Copy the .ifo, .idx, .syn, and .dict.dz files to your KOReader dictionaries folder.")
 
 
 if __name__ == "__main__":